@@ -1,17 +1,59 @@
+# Make all annotations lazy strings so type hints cost nothing at runtime
+from __future__ import annotations
+
 # Standard library (Python built-in modules)
+import atexit
 import json
 import logging
 import os
+import random
+import re
+import secrets
+import socket
+import ssl
+import string
 import time
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 # External library (Pre-installed in AWS Lambda runtime environment)
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from botocore.client import BaseClient
 
-# External library
-import pymysql
+# These names are only used in type hints - with lazy annotations the
+# imports can be skipped entirely at runtime
+if TYPE_CHECKING:
+    from typing import Any, Optional
+    from botocore.client import BaseClient
+    import pymysql
+
+# External library - imported lazily on first database use. createSecret and
+# finishSecret never touch MySQL, so their cold starts skip pymysql's 30+
+# submodule loads. _load_pymysql() rebinds these module globals; every
+# function that references pymysql at runtime (including in except clauses)
+# calls it before entering its try block.
+pymysql = None
+CLIENT = None
+
+def _load_pymysql() -> None:
+    """Import pymysql and its CLIENT constants on first database use."""
+    global pymysql, CLIENT
+    if pymysql is None:
+        import pymysql as _pymysql
+        from pymysql.constants import CLIENT as _CLIENT
+        pymysql = _pymysql
+        CLIENT = _CLIENT
+
+# External library (optional) - Rust-based JSON codec, 2-5x faster than the
+# stdlib. Declared in requirements.txt; fall back to stdlib json so a
+# deployment package built without the wheel still rotates correctly.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # Configuration and Constants
@@ -32,16 +74,22 @@ ENV_DB_PASSWORD_PROPAGATION_WAIT = 'DB_PASSWORD_PROPAGATION_WAIT'
 ENV_DB_CONNECTION_TEST_RETRIES = 'DB_CONNECTION_TEST_RETRIES'
 ENV_DB_CONNECTION_TEST_RETRY_DELAY = 'DB_CONNECTION_TEST_RETRY_DELAY'
 ENV_DB_CA_BUNDLE_PATH = 'DB_CA_BUNDLE_PATH'
+ENV_SECRET_CACHE_TTL = 'SECRET_CACHE_TTL'
+ENV_USE_AWS_PASSWORD_GEN = 'USE_AWS_PASSWORD_GEN'
 
 # Default values
 DEFAULT_PASSWORD_LENGTH = 32
 DEFAULT_EXCLUDE_CHARACTERS = '/@"\'\\'
 DEFAULT_MAX_SET_SECRET_RETRIES = 10
-DEFAULT_SET_SECRET_RETRY_DELAY = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_CAP = 5.0
 DEFAULT_DB_WAIT_TIME = 5
 DEFAULT_CONNECTION_RETRIES = 3
 DEFAULT_RETRY_DELAY = 5
 DEFAULT_CONNECTION_TIMEOUT = 30
+DEFAULT_SECRET_CACHE_TTL = 60
+DEFAULT_DESCRIBE_CACHE_TTL = 30
+DEFAULT_MASTER_PROPAGATION_WAIT = 8
 
 # Default privileges for initial app user setup (used only on first rotation)
 DEFAULT_APP_PRIVILEGES = 'SELECT,INSERT,UPDATE,DELETE,CREATE,DROP'
@@ -49,6 +97,7 @@ DEFAULT_APP_PRIVILEGES = 'SELECT,INSERT,UPDATE,DELETE,CREATE,DROP'
 # MySQL Error Codes
 MYSQL_ERROR_ACCESS_DENIED = 1045
 MYSQL_ERROR_ACCESS_DENIED_DB = 1044
+MYSQL_ERROR_CANNOT_USER = 1396
 MYSQL_ERROR_CONNECTION_REFUSED = 2003
 MYSQL_ERROR_UNKNOWN_HOST = 2005
 MYSQL_ERROR_SERVER_GONE = 2006
@@ -57,6 +106,224 @@ MYSQL_ERROR_SERVER_GONE = 2006
 VERSION_STAGE_CURRENT = 'AWSCURRENT'
 VERSION_STAGE_PENDING = 'AWSPENDING'
 
+# SQL templates - hoisted to module scope so they are not rebuilt per call.
+# Passwords and user names go through pymysql's parameterized (%s) path;
+# identifiers that MySQL cannot parameterize (privilege list, database name)
+# are validated against _IDENTIFIER_RE before being formatted in.
+_SQL_ALTER_USER = "ALTER USER %s@'%%' IDENTIFIED BY %s"
+_SQL_CREATE_USER = "CREATE USER %s@'%%' IDENTIFIED BY %s"
+_SQL_SHOW_GRANTS = "SHOW GRANTS FOR %s@'%%'"
+_SQL_DEFAULT_GRANT = "GRANT {privileges} ON {database}.* TO %s@'%%'"
+
+# Allowed characters for SQL identifiers that must be string-formatted
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z0-9_]+$')
+
+# GRANT statement parser - compiled once at module load so each statement
+# parsed by clone_user_privileges skips the regex compiler cache lookup
+_GRANT_RE = re.compile(r"(GRANT .+?)\s+TO\s+['\"]?(\w+)['\"]?@['\"]?([^'\"]+)['\"]?(.*?)(?:;)?$", re.IGNORECASE)
+
+# Default-privilege filter for should_skip_grant - a case-insensitive match
+# instead of upper-casing (and re-allocating) every statement checked.
+# Anchored at the start so non-matching statements are rejected immediately
+# rather than scanned to the end.
+_SKIP_RE = re.compile(r'\s*GRANT\s+USAGE\s+ON\s+\*\.\*', re.IGNORECASE)
+
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """
+    Environment-derived configuration, parsed once at cold start.
+
+    Warm invocations read plain attributes instead of repeating
+    os.environ lookups and int() conversions on every call. Required
+    values (master_secret_arn, app_user_1/2) stay Optional here so the
+    module stays import-safe; the step functions that need them still
+    validate and raise ValueError with the existing messages.
+    """
+    password_length: int
+    exclude_characters: str
+    db_wait: int
+    test_retries: int
+    test_retry_delay: int
+    ca_bundle_path: Optional[str]
+    secret_cache_ttl: int
+    master_secret_arn: Optional[str]
+    app_user_1: Optional[str]
+    app_user_2: Optional[str]
+
+# Parse all environment variables once at module load (cold start)
+CONFIG = EnvConfig(
+    password_length=int(os.environ.get(ENV_PASSWORD_LENGTH, DEFAULT_PASSWORD_LENGTH)),
+    exclude_characters=os.environ.get(ENV_EXCLUDE_CHARACTERS, DEFAULT_EXCLUDE_CHARACTERS),
+    db_wait=int(os.environ.get(ENV_DB_PASSWORD_PROPAGATION_WAIT, DEFAULT_DB_WAIT_TIME)),
+    test_retries=int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRIES, DEFAULT_CONNECTION_RETRIES)),
+    test_retry_delay=int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRY_DELAY, DEFAULT_RETRY_DELAY)),
+    ca_bundle_path=os.environ.get(ENV_DB_CA_BUNDLE_PATH),
+    secret_cache_ttl=int(os.environ.get(ENV_SECRET_CACHE_TTL, DEFAULT_SECRET_CACHE_TTL)),
+    master_secret_arn=os.environ.get(ENV_MASTER_SECRET_ARN),
+    app_user_1=os.environ.get(ENV_APP_USER_1),
+    app_user_2=os.environ.get(ENV_APP_USER_2)
+)
+
+# Password policy parameters for get_random_password - fixed for the lifetime
+# of the container, so the kwargs dict is built once instead of per API call.
+# Only used when USE_AWS_PASSWORD_GEN=1 selects the server-side generator.
+_RANDOM_PASSWORD_PARAMS = {
+    'PasswordLength': CONFIG.password_length,
+    'ExcludeCharacters': CONFIG.exclude_characters,
+    'ExcludeNumbers': False,
+    'ExcludePunctuation': False,
+    'ExcludeUppercase': False,
+    'ExcludeLowercase': False,
+    'IncludeSpace': False,
+    'RequireEachIncludedType': True
+}
+
+# Escape hatch: set USE_AWS_PASSWORD_GEN=1 to keep generating passwords via
+# the Secrets Manager API instead of the local CSPRNG (e.g. to enforce an
+# account-level password policy server-side)
+_USE_AWS_PASSWORD_GEN = os.environ.get(ENV_USE_AWS_PASSWORD_GEN) == '1'
+
+# Character pool for local password generation, built once from the same
+# policy the API parameters encode: letters + digits + punctuation, minus the
+# excluded characters (none of these classes contain whitespace). Each
+# class's surviving subset is kept separately so the per-class requirement
+# check can be skipped for any class EXCLUDE_CHARACTERS emptied entirely -
+# requiring a character the pool cannot produce would loop forever.
+_PASSWORD_POOL = [
+    c for c in string.ascii_letters + string.digits + string.punctuation
+    if c not in CONFIG.exclude_characters
+]
+_PASSWORD_UPPERCASE = frozenset(
+    c for c in string.ascii_uppercase if c not in CONFIG.exclude_characters
+)
+_PASSWORD_LOWERCASE = frozenset(
+    c for c in string.ascii_lowercase if c not in CONFIG.exclude_characters
+)
+_PASSWORD_DIGITS = frozenset(
+    c for c in string.digits if c not in CONFIG.exclude_characters
+)
+_PASSWORD_PUNCTUATION = frozenset(
+    c for c in string.punctuation if c not in CONFIG.exclude_characters
+)
+
+# Surface a missing MASTER_SECRET_ARN at cold start instead of only when
+# setSecret runs. Logged rather than raised: the other rotation steps do not
+# need the master secret, and an import failure would break all of them.
+if not CONFIG.master_secret_arn:
+    logger.warning("MASTER_SECRET_ARN environment variable is not set - setSecret will fail")
+
+# Application user names come from the environment and end up inside SQL
+# statements - reject anything outside the safe identifier charset up front
+for _user in (CONFIG.app_user_1, CONFIG.app_user_2):
+    if _user and not _IDENTIFIER_RE.match(_user):
+        raise ValueError(f"Invalid application user name (must match [A-Za-z0-9_]+): {_user!r}")
+
+# SSL context for database connections, built once at cold start so the CA
+# bundle (explicit via DB_CA_BUNDLE_PATH, or the system store) is read and
+# parsed a single time per container instead of on every connect.
+# create_default_context() enables certificate and hostname verification,
+# matching the previous per-connection ssl_verify_cert/ssl_verify_identity.
+if CONFIG.ca_bundle_path and os.path.exists(CONFIG.ca_bundle_path):
+    logger.info("Using SSL with explicit CA bundle: %s", CONFIG.ca_bundle_path)
+    _SSL_CONTEXT = ssl.create_default_context(cafile=CONFIG.ca_bundle_path)
+else:
+    logger.info("Using SSL with system default CA certificates")
+    _SSL_CONTEXT = ssl.create_default_context()
+
+# Secrets Manager client - created once at module load (cold start) and reused
+# across warm invocations so the credential chain and HTTPS connection pool
+# are not rebuilt on every rotation call.
+# The session pins the region explicitly (AWS_REGION is always set by the
+# Lambda runtime) and the Config sets adaptive-mode retries (client-side
+# rate limiting when many rotations share the account quota) plus tight
+# connect/read timeouts so a single slow API call cannot stall a rotation step.
+# Credentials are retrieved in order: Environment variables → AWS config files → IAM role (Lambda execution role)
+_SESSION = boto3.session.Session(region_name=os.environ.get('AWS_REGION'))
+# max_pool_connections + tcp_keepalive let every Secrets Manager call within
+# one rotation step (get/put secret value, update version stage) share the
+# same kept-alive TLS session instead of re-handshaking
+_CLIENT_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=3,
+    read_timeout=5,
+    max_pool_connections=4,
+    tcp_keepalive=True
+)
+SERVICE_CLIENT = _SESSION.client('secretsmanager', config=_CLIENT_CONFIG)
+
+# Compact JSON codec bound once at import. orjson when available (faster
+# and allocates less), otherwise a stdlib encoder preconfigured so
+# json.dumps' per-call argument parsing is still skipped.
+if orjson is not None:
+    def _JSON_ENCODE(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    _JSON_DECODE = orjson.loads
+else:
+    _JSON_ENCODE = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    _JSON_DECODE = json.loads
+
+# In-process TTL cache for the master secret value. The master secret changes
+# rarely, so warm invocations can skip the GetSecretValue round-trip. Entries
+# are evicted on authentication failures (MySQL 1045 / AccessDenied) so a
+# concurrent master rotation forces a fresh fetch on the next attempt.
+DEFAULT_MASTER_SECRET_CACHE_TTL = 300
+_MASTER_SECRET_CACHE: dict[str, Any] = {}  # arn -> (expires_at, secret_dict)
+
+def _invalidate_master_secret_cache(arn: str) -> None:
+    """Evict a cached master secret so the next lookup refetches from AWS."""
+    _MASTER_SECRET_CACHE.pop(arn, None)
+    _invalidate_secret_cache(arn)
+
+# General TTL cache for get_secret(), keyed by (arn, stage, token). Short TTL
+# (SECRET_CACHE_TTL, default 60s) because app secret versions change within a
+# single rotation; the master secret additionally uses the longer cache above.
+# Invalidated alongside the master cache on authentication failures.
+_SECRET_CACHE: dict[tuple, Any] = {}  # (arn, stage, token) -> (expires_at, secret_dict)
+
+def _invalidate_secret_cache(arn: str, stage: Optional[str] = None) -> None:
+    """Evict cached get_secret() entries for an ARN (optionally one stage)."""
+    for key in [k for k in _SECRET_CACHE if k[0] == arn and (stage is None or k[1] == stage)]:
+        _SECRET_CACHE.pop(key, None)
+    _DESCRIBE_CACHE.pop(arn, None)
+
+# Short TTL cache for describe_secret metadata (version-to-stage mapping).
+# Used for existence probes so they skip the KMS Decrypt that
+# get_secret_value performs just to test whether a stage exists.
+_DESCRIBE_CACHE: dict[str, Any] = {}  # arn -> (expires_at, describe_secret response)
+
+def _describe_secret_cached(service_client: BaseClient, arn: str) -> dict[str, Any]:
+    """Return describe_secret metadata, cached for DEFAULT_DESCRIBE_CACHE_TTL seconds."""
+    cached = _DESCRIBE_CACHE.get(arn)
+    if cached is not None:
+        expires_at, description = cached
+        if time.monotonic() < expires_at:
+            return description
+        _DESCRIBE_CACHE.pop(arn, None)
+    description = service_client.describe_secret(SecretId=arn)
+    _DESCRIBE_CACHE[arn] = (time.monotonic() + DEFAULT_DESCRIBE_CACHE_TTL, description)
+    return description
+
+# Absolute deadline for the current invocation, derived from the Lambda
+# context's remaining time (minus a buffer for cleanup and logging). Retry
+# loops check it so the function fails with a real error instead of being
+# killed mid-sleep by the platform timeout.
+_INVOCATION_DEADLINE: Optional[float] = None
+DEADLINE_BUFFER_SECONDS = 5.0
+
+def _past_deadline() -> bool:
+    """True when the invocation deadline (if known) has been reached."""
+    return _INVOCATION_DEADLINE is not None and time.monotonic() >= _INVOCATION_DEADLINE
+
+def _sleep_backoff(attempt: int, base: float = DEFAULT_BACKOFF_BASE, cap: float = DEFAULT_BACKOFF_CAP) -> None:
+    """
+    Sleep using full-jitter exponential backoff.
+
+    The random spread avoids thundering-herd retries when concurrent
+    rotations contend, and the low base keeps the common single-retry
+    case fast (the old fixed delays over-waited in the uncontended case).
+    """
+    time.sleep(random.uniform(0, min(cap, base * (2 ** attempt))))
+
 # ============================================================================
 # AWS Lambda Handler (First function called by AWS Secrets Manager)
 # ============================================================================
@@ -75,9 +342,8 @@ VERSION_STAGE_PENDING = 'AWSPENDING'
 # Step 2: setSecret
 #   - Get AWSCURRENT and AWSPENDING secret values
 #   - Connect to database as master user for SQL operations
-#   - Check if new user (APP_USER_2) exists
-#   - If exists: ALTER USER password
-#   - If not exists: CREATE USER + clone privileges from old user (APP_USER_1)
+#   - ALTER USER password (common case: user already exists)
+#   - If user missing (error 1396): CREATE USER + clone privileges from old user (APP_USER_1)
 #   - Wait for RDS password propagation (default: 5 seconds)
 #   - Handles concurrent master rotation with retry logic
 #
@@ -98,7 +364,7 @@ VERSION_STAGE_PENDING = 'AWSPENDING'
 # 4. pymysql.err.MySQLError: General MySQL errors
 # 5. Exception: Catch-all for unexpected errors
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     Purpose:
         Entry point for AWS Secrets Manager app user rotation (Multi-user strategy).
@@ -147,7 +413,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "SecretId": event.get("SecretId", "N/A"),
         "RequestId": context.aws_request_id if context else "N/A"
     }
-    logger.info(f"App rotation event received: {json.dumps(log_event)}")
+    # Pass the dict directly - the logging framework only stringifies it
+    # if the record is actually emitted
+    logger.info("App rotation event received: %s", log_event)
     
     # Validate that all required keys exist in the event
     try:
@@ -155,32 +423,41 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         arn = event['SecretId']
         token = event['ClientRequestToken']
     except KeyError as e:
-        logger.error(f"Missing required event parameter: {str(e)}")
+        logger.error("Missing required event parameter: %s", str(e))
         raise ValueError(f"Missing required event parameter: {str(e)}")
     
-    # Initialize Secrets Manager client
-    # Credentials are retrieved in order: Environment variables → AWS config files → IAM role (Lambda execution role)
-    service_client = boto3.client('secretsmanager')
+    # Reuse the module-level Secrets Manager client (created once at cold start)
+    service_client = SERVICE_CLIENT
+
+    # Derive an absolute deadline from the Lambda context so retry loops can
+    # bail out with a clean error before the platform kills the invocation
+    global _INVOCATION_DEADLINE
+    remaining_ms = getattr(context, 'get_remaining_time_in_millis', None)
+    if callable(remaining_ms):
+        _INVOCATION_DEADLINE = time.monotonic() + max(remaining_ms() / 1000.0 - DEADLINE_BUFFER_SECONDS, 1.0)
+    else:
+        _INVOCATION_DEADLINE = None
+
+    # Validate the step name with a single hashed membership test so the
+    # dispatch below can be unconditional
+    if step not in _VALID_STEPS:
+        logger.error("Unknown step: %s", step)
+        raise ValueError(f"Unknown step: {step}")
 
     # Execute the appropriate rotation step (main logic)
+    # Step handlers are resolved via the module-level dispatch table
+    # (_STEP_HANDLERS, defined after the step functions below) - a single
+    # dict lookup instead of a four-branch if/elif chain.
     try:
-        if step == 'createSecret':
-            create_secret(service_client, arn, token)
-        elif step == 'setSecret':
-            set_secret(service_client, arn, token)
-        elif step == 'testSecret':
-            test_secret(service_client, arn, token)
-        elif step == 'finishSecret':
-            finish_secret(service_client, arn, token)
-        else:
-            logger.error(f"Unknown step: {step}")
-            raise ValueError(f"Unknown step: {step}")
-            
-        logger.info(f"Successfully completed app rotation step {step} for secret {arn}")
+        _STEP_HANDLERS[step](service_client, arn, token)
+
+        logger.info("Successfully completed app rotation step %s for secret %s", step, arn)
         return {"statusCode": 200, "body": f"App rotation step {step} completed successfully"}
 
     except Exception as e:
-        logger.error(f"Error during app rotation step {step}: {str(e)}", exc_info=True)
+        # The Lambda runtime logs the full stack for the unhandled exception,
+        # so skip exc_info here to avoid formatting the traceback twice
+        logger.error("Error during app rotation step %s: %s", step, str(e))
         raise
 
 # ============================================================================
@@ -193,14 +470,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 #   create_secret()
 #   ├── get_secret() ───────────────────────────────── Get AWSCURRENT secret value
 #   └── create_new_secret_value() ──────────────────── Alternate username and generate new password
-#       └── get_random_password() ──────────────────── AWS Secrets Manager password generation
+#       └── get_random_password() ──────────────────── Local CSPRNG password generation
 #
 #   set_secret() [Complex - Concurrent master rotation support]
 #   ├── get_secret() ───────────────────────────────── Get AWSCURRENT and AWSPENDING secret values
 #   ├── get_master_secret_with_fallback() ──────────── Handle concurrent master rotation
 #   │   └── get_secret() ───────────────────────────── Try AWSPENDING, fallback to AWSCURRENT secret values
 #   ├── create_tls_connection() ────────────────────── Create SSL/TLS connection as master user
-#   ├── user_exists() ──────────────────────────────── Check if user exists in mysql.user
 #   └── clone_user_privileges() ────────────────────── Copy privileges from old to new user
 #       ├── should_skip_grant() ────────────────────── Filter USAGE grants
 #       └── parse_grant_statement() ────────────────── Regex parsing of GRANT statements
@@ -219,10 +495,10 @@ def create_secret(service_client: BaseClient, arn: str, token: str) -> None:
         Create a new secret version with AWSPENDING stage, alternating username and generating new password.
 
     Flow Summary:
-        1. Check if AWSPENDING version already exists for this token.
-        2. Get current secret (AWSCURRENT) from Secrets Manager.
-        3. Generate new secret with alternated username and updated password.
-        4. Store new secret with AWSPENDING stage.
+        1. Check if AWSPENDING version already exists for this token and
+           get current secret (AWSCURRENT) from Secrets Manager in parallel.
+        2. Generate new secret with alternated username and updated password.
+        3. Store new secret with AWSPENDING stage.
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
@@ -246,22 +522,30 @@ def create_secret(service_client: BaseClient, arn: str, token: str) -> None:
     """
 
     try:
+        # The AWSPENDING existence probe and the AWSCURRENT fetch are
+        # independent API calls - run them concurrently so the probe's
+        # round-trip hides behind the fetch in the common (no replay) path.
+        # The probe uses describe_secret metadata: testing stage existence
+        # via get_secret_value would pay a KMS Decrypt just for a boolean.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            describe_future = executor.submit(_describe_secret_cached, service_client, arn)
+            current_future = executor.submit(
+                get_secret, service_client, arn, None, VERSION_STAGE_CURRENT
+            )
+
         # Skip if AWSPENDING already exists for the same token
         try:
-            service_client.get_secret_value(SecretId=arn, VersionId=token, VersionStage=VERSION_STAGE_PENDING)
-            logger.info(f"AWSPENDING version already exists for secret {arn} with token {token}, skipping.")
-            return
-        except service_client.exceptions.ResourceNotFoundException:
-            # Expected - AWSPENDING doesn't exist yet, continue with creation
-            pass
+            token_stages = describe_future.result().get('VersionIdsToStages', {}).get(token, [])
         except ClientError as e:
-            if e.response['Error']['Code'] != 'ResourceNotFoundException':
-                logger.error(f"Unexpected error checking AWSPENDING for {arn}: {e}")
-                raise
-        
-        # Get AWSCURRENT secret value using get_secret function()
+            logger.error("Unexpected error checking AWSPENDING for %s: %s", arn, e)
+            raise
+        if VERSION_STAGE_PENDING in token_stages:
+            logger.info("AWSPENDING version already exists for secret %s with token %s, skipping.", arn, token)
+            return
+
+        # Get AWSCURRENT secret value from the concurrent fetch above
         # Generate new secret value using create_new_secret_value function()
-        current_secret = get_secret(service_client, arn, version_stage=VERSION_STAGE_CURRENT)
+        current_secret = current_future.result()
         new_secret = create_new_secret_value(service_client, current_secret)
         
         # Store new secret as AWSPENDING version
@@ -269,15 +553,18 @@ def create_secret(service_client: BaseClient, arn: str, token: str) -> None:
         service_client.put_secret_value(
             SecretId=arn,
             ClientRequestToken=token,
-            SecretString=json.dumps(new_secret),
+            SecretString=_JSON_ENCODE(new_secret),
             VersionStages=[VERSION_STAGE_PENDING]
         )
-        logger.info(f"Successfully created new AWSPENDING version for secret {arn} with token {token}.")
+        # The stage map just changed - drop the cached describe so a replayed
+        # createSecret re-probes instead of re-putting a different password
+        _DESCRIBE_CACHE.pop(arn, None)
+        logger.info("Successfully created new AWSPENDING version for secret %s with token %s.", arn, token)
     except ClientError as e:
-        logger.error(f"ClientError in create_secret for ARN {arn}, token {token}: {e}", exc_info=True)
+        logger.error("ClientError in create_secret for ARN %s, token %s: %s", arn, token, e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in create_secret for ARN {arn}, token {token}: {e}", exc_info=True)
+        logger.error("Unexpected error in create_secret for ARN %s, token %s: %s", arn, token, e)
         raise
 
 def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
@@ -358,33 +645,38 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
         
 
     Note:
-        When concurrent master rotation is detected (AWSPENDING exists), waits 8 seconds
-        before first connection attempt to allow RDS password propagation. This minimizes
-        authentication failures and reduces unnecessary warning logs. Retry logic (max 10
-        attempts) handles any remaining temporary auth failures.
+        When concurrent master rotation is detected (AWSPENDING exists), probes with the
+        new master credentials (max 8 seconds) before the first SQL attempt so connection
+        happens as soon as RDS propagation completes. This minimizes authentication
+        failures and reduces unnecessary warning logs. Retry logic (max 10 attempts)
+        handles any remaining temporary auth failures.
     """
 
+    # Bind pymysql before the try block - its except clauses reference it
+    _load_pymysql()
+
     try:
-        logger.info(f"Setting app user password using SQL with master user credentials for secret {arn}")
+        logger.info("Setting app user password using SQL with master user credentials for secret %s", arn)
         
-        # Get current and pending app secrets values using get_secret function()
+        # Get master secret ARN from module-level config
+        master_secret_arn = CONFIG.master_secret_arn
+        if not master_secret_arn:
+            raise ValueError("MASTER_SECRET_ARN environment variable is not set")
+
+        # Fetch app and master secrets in parallel (one round trip instead of four)
         try:
-            current_secret = get_secret(service_client, arn, version_stage=VERSION_STAGE_CURRENT)
-            pending_secret = get_secret(service_client, arn, token, VERSION_STAGE_PENDING)
+            prefetched = _prefetch_rotation_secrets(service_client, arn, token, master_secret_arn)
+            current_secret = prefetched['current_secret']
+            pending_secret = prefetched['pending_secret']
         except ClientError as e:
-            logger.error(f"Failed to get secrets from Secrets Manager for {arn}: {e}")
+            logger.error("Failed to get secrets from Secrets Manager for %s: %s", arn, e)
             raise
-        
+
         # Extract host and port from AWSCURRENT or AWSPENDING secret values
         host = current_secret.get('host') or pending_secret.get('host')
         port = current_secret.get('port') or pending_secret.get('port')
         database = current_secret.get('database') or pending_secret.get('database')
-        
-        # Get master secret ARN from environment variables
-        master_secret_arn = os.environ.get(ENV_MASTER_SECRET_ARN)
-        if not master_secret_arn:
-            raise ValueError("MASTER_SECRET_ARN environment variable is not set")
-        
+
         # Extract username from AWSCURRENT secret value and new username and new password from AWSPENDING secret value
         current_username = current_secret.get('username')
         new_username = pending_secret.get('username')
@@ -406,25 +698,44 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
         # Convert port to integer
         port = int(port)
         
-        logger.info(f"Updating app username and password using master credentials on {host}:{port}")
+        logger.info("Updating app username and password using master credentials on %s:%s", host, port)
 
-        # Initialize retry count(default: 10 attempts) and delay time(default: 3 seconds)
+        # Initialize retry count(default: 10 attempts); retry delays use
+        # jittered exponential backoff via _sleep_backoff()
         max_retries = DEFAULT_MAX_SET_SECRET_RETRIES
-        retry_delay = DEFAULT_SET_SECRET_RETRY_DELAY
-        
-        # Check if master rotation is in progress
-        master_rotation_in_progress = False
-        try:
-            service_client.get_secret_value(SecretId=master_secret_arn, VersionStage=VERSION_STAGE_PENDING)
-            master_rotation_in_progress = True
-            logger.info("Master rotation is in progress (AWSPENDING detected). Waiting 8 seconds for RDS password propagation before attempting connection...")
-            # Wait for 8 seconds for RDS password propagation
-            time.sleep(8) 
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                logger.info("No concurrent master rotation detected. Proceeding immediately.")
+
+        # Check if master rotation is in progress (detected during the parallel prefetch)
+        master_rotation_in_progress = prefetched['master_rotation_in_progress']
+        if master_rotation_in_progress:
+            # Probe with the new master credentials instead of sleeping a
+            # fixed 8 seconds - RDS usually propagates in 1-3s, so this
+            # returns as soon as the password actually works (bounded by
+            # the same 8 second budget as the old unconditional sleep)
+            logger.info("Master rotation is in progress (AWSPENDING detected). Probing for RDS password propagation (max %s seconds)...", DEFAULT_MASTER_PROPAGATION_WAIT)
+            master_secret = prefetched['master_secret'] or {}
+            if master_secret.get('username') and master_secret.get('password'):
+                # Probe through get_master_conn so the handshake that confirms
+                # propagation is the same cached connection the retry loop
+                # reuses - the successful probe is not thrown away
+                deadline = time.monotonic() + DEFAULT_MASTER_PROPAGATION_WAIT
+                delay = 0.1
+                while True:
+                    try:
+                        get_master_conn(host, port, master_secret['username'], master_secret['password'])
+                        logger.info("New master credentials are active; keeping the probe connection for reuse")
+                        break
+                    except pymysql.err.OperationalError as e:
+                        error_code = e.args[0] if e.args else None
+                        remaining = deadline - time.monotonic()
+                        if error_code != MYSQL_ERROR_ACCESS_DENIED or remaining <= 0:
+                            logger.warning("Master propagation not confirmed within %s seconds: %s", DEFAULT_MASTER_PROPAGATION_WAIT, str(e))
+                            break
+                        time.sleep(min(delay, remaining))
+                        delay = min(delay * 2, 0.5)
             else:
-                logger.warning(f"Could not check master rotation status: {e}")
+                time.sleep(DEFAULT_MASTER_PROPAGATION_WAIT)
+        else:
+            logger.info("No concurrent master rotation detected. Proceeding immediately.")
         
         # Create new user(APP_USER_2) or update existing user(APP_USER_2)'s password using master user credentials.
         # If authentication fails, the operation is automatically retried several times.
@@ -440,42 +751,45 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
                 if not all([master_username, master_password]):
                     raise ValueError("Master user credentials are incomplete")
                 
-                logger.info(f"Connecting as master user '{master_username}' to manage app user [attempt {attempt + 1}/{max_retries}]")
+                logger.info("Connecting as master user '%s' to manage app user [attempt %s/%s]", master_username, attempt + 1, max_retries)
                 
-                # Establish SSL/TLS connection
-                conn = create_tls_connection(host, port, master_username, master_password)
+                # Establish (or reuse the cached) SSL/TLS connection
+                conn = get_master_conn(host, port, master_username, master_password)
                 
                 # Create new user(APP_USER_2) or update existing user(APP_USER_2)'s password using master user credentials
                 with conn.cursor() as cur:
-                    # Check if new user(APP_USER_2) exists
-                    if user_exists(cur, new_username):
-                        # User(APP_USER_2) exists: Update password only
-                        logger.info(f"User '{new_username}' exists, updating password")
-                        cur.execute("ALTER USER %s@'%%' IDENTIFIED BY %s", (new_username, new_password))
-                    else:
+                    # Try ALTER USER first - on 3rd+ rotations the user always
+                    # exists, so the common path is one round-trip with no
+                    # existence SELECT. Error 1396 means the user is missing
+                    # (first two rotations only): create it and clone privileges.
+                    try:
+                        logger.info("Updating password for user '%s'", new_username)
+                        cur.execute(_SQL_ALTER_USER, (new_username, new_password))
+                    except pymysql.MySQLError as e:
+                        if not (e.args and e.args[0] == MYSQL_ERROR_CANNOT_USER):
+                            raise
                         # User(APP_USER_2) does not exist: Create new user and clone privileges
-                        logger.info(f"User '{new_username}' does not exist, creating new user")
-                        cur.execute("CREATE USER %s@'%%' IDENTIFIED BY %s", (new_username, new_password))
-                        
+                        logger.info("User '%s' does not exist, creating new user", new_username)
+                        cur.execute(_SQL_CREATE_USER, (new_username, new_password))
+
                         # Clone privileges from current user(APP_USER_1) to new user(APP_USER_2)
                         # Pass database name from secret for default privilege grant on initial setup
                         clone_user_privileges(cur, current_username, new_username, database)
-                    
-                    logger.info(f"Successfully set password for user '{new_username}'")
+
+                    logger.info("Successfully set password for user '%s'", new_username)
                 
                 conn.commit()
-                conn.close()
-                
-                # Wait for password change to propagate in database (default: 5 seconds)
-                wait_time = int(os.environ.get(ENV_DB_PASSWORD_PROPAGATION_WAIT, DEFAULT_DB_WAIT_TIME))
-                logger.info(f"Waiting {wait_time} seconds for database password change to propagate...")
-                time.sleep(wait_time)
-                logger.info(f"Password propagation wait completed")
+                # The connection stays cached for reuse on the next warm invocation
+
+                # Wait for the password change to propagate, probing with the
+                # new credentials so the common fast case returns early
+                # (bounded by DB_PASSWORD_PROPAGATION_WAIT, default: 5 seconds)
+                wait_for_propagation(host, port, new_username, new_password, max_wait=CONFIG.db_wait)
                 
                 # Log retry statistics on success
                 if attempt > 0:
-                    logger.info(f"Database operation succeeded after {attempt + 1} attempt(s). "
-                              f"Previous failures were likely due to concurrent master rotation.")
+                    logger.info("Database operation succeeded after %s attempt(s). "
+                              "Previous failures were likely due to concurrent master rotation.", attempt + 1)
                 
                 break  # Success - exit retry loop
                 
@@ -489,38 +803,56 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
                     error_code = e.args[0]
                     if error_code == MYSQL_ERROR_ACCESS_DENIED:  # 1045
                         is_auth_error = True
-                
+                if isinstance(e, ClientError) and e.response['Error']['Code'] == 'AccessDeniedException':
+                    is_auth_error = True
+
+                # Evict the cached master secret on authentication failures so
+                # the next attempt refetches fresh credentials from AWS
+                if is_auth_error:
+                    _invalidate_master_secret_cache(master_secret_arn)
+
+                # Drop the cached connection - it may be mid-transaction or broken
+                drop_master_conn()
+
                 # Last attempt: Log error and raise exception
                 if attempt_num == max_retries:
                     if is_auth_error:
-                        logger.error(f"Authentication failed after {max_retries} attempts. "
-                                   f"Master credentials may be rotating concurrently. Error: {str(e)}")
+                        logger.error("Authentication failed after %s attempts. "
+                                   "Master credentials may be rotating concurrently. Error: %s", max_retries, str(e))
                     else:
-                        logger.error(f"Database error after {max_retries} attempts: {str(e)}")
+                        logger.error("Database error after %s attempts: %s", max_retries, str(e))
                     raise
                 
-                # Not the last attempt: Wait and retry
+                # Not the last attempt: Wait with jittered backoff and retry
                 else:
                     if is_auth_error:
                         # Use INFO level for early attempts during concurrent rotation (expected), WARNING for later attempts (unexpected)
                         if master_rotation_in_progress and attempt_num <= 3:
-                            logger.info(f"Authentication failed on attempt {attempt_num}/{max_retries} during concurrent master rotation (expected). "
-                                      f"Retrying in {retry_delay} seconds...")
+                            logger.info("Authentication failed on attempt %s/%s during concurrent master rotation (expected). "
+                                      "Retrying after jittered backoff...", attempt_num, max_retries)
                         else:
-                            logger.warning(f"Authentication failed on attempt {attempt_num}/{max_retries}. "
-                                         f"This may be caused by concurrent master rotation. "
-                                         f"Will retry with fresh master credentials in {retry_delay} seconds...")
+                            logger.warning("Authentication failed on attempt %s/%s. "
+                                         "This may be caused by concurrent master rotation. "
+                                         "Will retry with fresh master credentials after jittered backoff...", attempt_num, max_retries)
                     else:
                         # Retry for other database errors
-                        logger.warning(f"Database error on attempt {attempt_num}/{max_retries}: {str(e)}. "
-                                     f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay = min(retry_delay * 2, 30)  # Exponential backoff (max 30s)
+                        logger.warning("Database error on attempt %s/%s: %s. "
+                                     "Retrying after jittered backoff...", attempt_num, max_retries, str(e))
+                    # Stop retrying with a real error rather than letting the
+                    # platform timeout kill the invocation mid-sleep
+                    if _past_deadline():
+                        logger.error("Lambda deadline approaching after %s attempt(s); aborting retries", attempt_num)
+                        raise
+                    # First auth failure during a known master rotation needs
+                    # no extra delay - the upfront propagation probe already
+                    # waited, so retry immediately with fresh credentials
+                    if not (is_auth_error and master_rotation_in_progress and attempt == 0):
+                        _sleep_backoff(attempt)
         
-        logger.info(f"App user password set successfully for '{new_username}'")
+        logger.info("App user password set successfully for '%s'", new_username)
         
     except Exception as e:
-        logger.error(f"Error in set_secret for app: {str(e)}")
+        logger.error("Error in set_secret for app: %s", str(e))
         raise
 
 def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
@@ -561,10 +893,13 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
         early connection attempts. These errors are expected and will trigger retries.
     """
 
+    # Bind pymysql before the try block - its except clauses reference it
+    _load_pymysql()
+
     try:
         # Get AWSPENDING secret value using get_secret function()
         pending_secret = get_secret(service_client, arn, token, VERSION_STAGE_PENDING)
-        
+
         # Extract database connection parameters from AWSPENDING secret value
         host = pending_secret.get('host')
         port = pending_secret.get('port')
@@ -578,11 +913,11 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
         # Convert port to integer
         port = int(port)
         
-        logger.info(f"Testing connection with new app password for user {username} for secret {arn}")
+        logger.info("Testing connection with new app password for user %s for secret %s", username, arn)
         
         # Retry configuration for database password propagation
-        max_retries = int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRIES, DEFAULT_CONNECTION_RETRIES))
-        retry_delay = int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRY_DELAY, DEFAULT_RETRY_DELAY))
+        max_retries = CONFIG.test_retries
+        retry_delay = CONFIG.test_retry_delay
         
         last_exception = None
         # Python's range(start, stop) generates numbers from start to stop-1
@@ -590,8 +925,8 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
             try:
                 # Test database connection with new password using test_database_connection function()
                 test_database_connection(host, port, username, password)
-                logger.info(f"Successfully connected with new app password for user {username} for secret {arn}")
-                logger.info(f"App secret tested successfully for {arn}")
+                logger.info("Successfully connected with new app password for user %s for secret %s", username, arn)
+                logger.info("App secret tested successfully for %s", arn)
                 return  # Success - exit function
                 
             except pymysql.err.OperationalError as e:
@@ -599,25 +934,26 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
                 error_code = e.args[0] if e.args else None
                 
                 # Retry if authentication error (1045) occurs and it's not the last attempt
-                if error_code == MYSQL_ERROR_ACCESS_DENIED and attempt < max_retries:
+                # (and the Lambda deadline still leaves room for another round)
+                if error_code == MYSQL_ERROR_ACCESS_DENIED and attempt < max_retries and not _past_deadline():
                     # Write a warning to the log, then wait and retry
-                    logger.warning(f"Authentication failed on attempt {attempt}/{max_retries}. "
-                                 f"Database password may still be propagating. Waiting {retry_delay} seconds before retry...")
-                    time.sleep(retry_delay)
+                    logger.warning("Authentication failed on attempt %s/%s. "
+                                 "Database password may still be propagating. Retrying after jittered backoff...", attempt, max_retries)
+                    _sleep_backoff(attempt, cap=retry_delay)
                 else:
                     # Non-retryable error or last attempt failed - raise exception
                     raise
                     
             except Exception as e:
                 # Non-retryable errors (network issues, etc.)
-                logger.error(f"Non-retryable error during connection test: {str(e)}")
+                logger.error("Non-retryable error during connection test: %s", str(e))
                 raise
         
-        logger.error(f"All {max_retries} connection attempts failed for secret {arn}")
+        logger.error("All %s connection attempts failed for secret %s", max_retries, arn)
         raise last_exception
         
     except Exception as e:
-        logger.error(f"Error in test_secret for app {arn}: {str(e)}")
+        logger.error("Error in test_secret for app %s: %s", arn, str(e))
         raise
 
 def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
@@ -664,26 +1000,48 @@ def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
         # Get current version ID using get_current_version function()
         current_version_id = get_current_version(service_client, arn)
         
-        # Skip if already current
+        # Skip if already current - Secrets Manager retries finishSecret
+        # aggressively, so this early return avoids a redundant
+        # update_secret_version_stage call on every replay
         if current_version_id == token:
-            logger.info(f"Secret {arn} is already current, skipping version update")
+            logger.info("Secret %s is already current, skipping version update", arn)
             return
-        
+
         # Promote AWSPENDING to AWSCURRENT
-        service_client.update_secret_version_stage(
-            SecretId=arn,
-            VersionStage=VERSION_STAGE_CURRENT,
-            MoveToVersionId=token,
-            RemoveFromVersionId=current_version_id
-        )
-        
-        logger.info(f"App secret rotation completed successfully for {arn}")
+        # RemoveFromVersionId is only passed when an AWSCURRENT version exists
+        params = {
+            'SecretId': arn,
+            'VersionStage': VERSION_STAGE_CURRENT,
+            'MoveToVersionId': token
+        }
+        if current_version_id is not None:
+            params['RemoveFromVersionId'] = current_version_id
+        service_client.update_secret_version_stage(**params)
+
+        # The stage labels just moved - drop cached values for this secret so
+        # the next rotation (or a fast follow-up) never reads a stale stage
+        _invalidate_secret_cache(arn)
+
+        logger.info("App secret rotation completed successfully for %s", arn)
         logger.info("Applications will now use the new user credentials on next connection")
         
     except Exception as e:
-        logger.error(f"Error in finish_secret for app {arn}: {str(e)}")
+        logger.error("Error in finish_secret for app %s: %s", arn, str(e))
         raise
 
+# Dispatch table mapping Secrets Manager rotation steps to their handlers.
+# Built once at import time; lambda_handler resolves the step with a single
+# dict lookup.
+_STEP_HANDLERS = {
+    'createSecret': create_secret,
+    'setSecret': set_secret,
+    'testSecret': test_secret,
+    'finishSecret': finish_secret
+}
+
+# Valid step names derived from the dispatch table (frozen for O(1) membership tests)
+_VALID_STEPS = frozenset(_STEP_HANDLERS)
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -691,11 +1049,13 @@ def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
 #
 # Functions:
 #   - get_secret(): Get secret value from Secrets Manager
+#   - _prefetch_rotation_secrets(): Parallel fetch of app/master secrets
 #   - create_new_secret_value(): Alternate username and generate password
-#   - get_random_password(): Generate secure password via AWS API
+#   - get_random_password(): Generate secure password locally (secrets module)
 #   - get_master_secret_with_fallback(): Handle concurrent master rotation
 #   - create_tls_connection(): Create SSL/TLS database connection
-#   - user_exists(): Check if database user exists
+#   - get_master_conn() / drop_master_conn(): Pooled connection reuse
+#   - wait_for_propagation(): Probe until a new password becomes active
 #   - clone_user_privileges(): Copy all privileges between users
 #   - should_skip_grant(): Filter default/empty grants
 #   - parse_grant_statement(): Parse GRANT syntax with regex
@@ -707,7 +1067,7 @@ def get_secret(
     arn: str, 
     token: Optional[str] = None, 
     version_stage: str = VERSION_STAGE_CURRENT
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Purpose:
         Get secret value from AWS Secrets Manager for the specified version stage.
@@ -743,6 +1103,17 @@ def get_secret(
         https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager/client/get_secret_value.html
     """
     
+    # Serve from the in-process TTL cache when the entry is still fresh -
+    # retries and repeated steps within one rotation skip the API round-trip
+    cache_key = (arn, version_stage, token)
+    cached = _SECRET_CACHE.get(cache_key)
+    if cached is not None:
+        expires_at, secret = cached
+        if time.monotonic() < expires_at:
+            logger.debug("Secret cache hit for %s (%s)", arn, version_stage)
+            return secret
+        _SECRET_CACHE.pop(cache_key, None)
+
     try:
         params = {
             'SecretId': arn,
@@ -755,24 +1126,122 @@ def get_secret(
 
         # Get secret value from AWS Secrets Manager and parse JSON
         response = service_client.get_secret_value(**params)
-        return json.loads(response['SecretString'])
+        secret = _JSON_DECODE(response['SecretString'])
+        _SECRET_CACHE[cache_key] = (time.monotonic() + CONFIG.secret_cache_ttl, secret)
+        return secret
 
     except ClientError as e:
-        logger.error(f"Error retrieving secret: '{arn}' {e}")
+        logger.error("Error retrieving secret: '%s' %s", arn, e)
         raise
 
-def create_new_secret_value(service_client: BaseClient, current_secret: Dict[str, Any]) -> Dict[str, Any]:
+def _prefetch_rotation_secrets(
+    service_client: BaseClient,
+    arn: str,
+    token: str,
+    master_secret_arn: str
+) -> dict[str, Any]:
+    """
+    Purpose:
+        Fetch every secret set_secret() needs in parallel to cut cold-path
+        latency (four sequential Secrets Manager round trips become one).
+
+    Flow Summary:
+        1. Submit app AWSCURRENT, app AWSPENDING, a master describe_secret
+           probe and the master AWSCURRENT fetch to a small thread pool.
+        2. A master version staged AWSPENDING means a concurrent master
+           rotation is in progress; prefer that version as the master secret.
+        3. Seed the master secret TTL cache so the retry loop in
+           set_secret() does not refetch immediately.
+
+    Args:
+        service_client (BaseClient): Boto3 Secrets Manager client
+        arn (str): ARN of the app secret being rotated
+        token (str): Client request token for the AWSPENDING app version
+        master_secret_arn (str): ARN of the master user secret
+
+    Returns:
+        dict: Keys 'current_secret', 'pending_secret', 'master_secret'
+              (may be None), 'master_rotation_in_progress'
+
+    Raises:
+        ClientError: If the app secret versions cannot be retrieved
+
+    Note:
+        Master secret fetch failures are logged but not raised - the retry
+        loop in set_secret() fetches master credentials on every attempt
+        via get_master_secret_with_fallback() anyway.
+    """
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        current_future = executor.submit(get_secret, service_client, arn, None, VERSION_STAGE_CURRENT)
+        pending_future = executor.submit(get_secret, service_client, arn, token, VERSION_STAGE_PENDING)
+        master_describe_future = executor.submit(_describe_secret_cached, service_client, master_secret_arn)
+        master_current_future = executor.submit(get_secret, service_client, master_secret_arn, None, VERSION_STAGE_CURRENT)
+
+    # App secret versions are required - propagate failures to the caller
+    current_secret = current_future.result()
+    pending_secret = pending_future.result()
+
+    # A master version staged AWSPENDING means a concurrent master rotation.
+    # describe_secret metadata answers that without the KMS Decrypt a
+    # get_secret_value existence probe would pay.
+    master_rotation_in_progress = False
+    try:
+        description = master_describe_future.result()
+        master_rotation_in_progress = any(
+            VERSION_STAGE_PENDING in stages
+            for stages in description.get('VersionIdsToStages', {}).values()
+        )
+    except ClientError as e:
+        logger.warning("Could not check master rotation status: %s", e)
+
+    # Prefer the in-flight AWSPENDING master password when one exists - the
+    # database may already be using it (fetched only in the rare concurrent
+    # rotation case, so the common path stays at four parallel calls)
+    master_secret = None
+    if master_rotation_in_progress:
+        try:
+            master_secret = get_secret(service_client, master_secret_arn, None, VERSION_STAGE_PENDING)
+        except ClientError as e:
+            logger.warning("Could not fetch pending master secret: %s", e)
+
+    if master_secret is None:
+        try:
+            master_secret = master_current_future.result()
+        except ClientError as e:
+            logger.warning("Could not prefetch master secret, retry loop will fetch it: %s", e)
+    else:
+        # Drain the unused future so its exception (if any) is consumed
+        try:
+            master_current_future.result()
+        except ClientError:
+            pass
+
+    # Seed the TTL cache so the first retry-loop attempt reuses this fetch
+    if master_secret is not None:
+        _MASTER_SECRET_CACHE[master_secret_arn] = (
+            time.monotonic() + DEFAULT_MASTER_SECRET_CACHE_TTL,
+            master_secret,
+        )
+
+    return {
+        'current_secret': current_secret,
+        'pending_secret': pending_secret,
+        'master_secret': master_secret,
+        'master_rotation_in_progress': master_rotation_in_progress,
+    }
+
+def create_new_secret_value(service_client: BaseClient, current_secret: dict[str, Any]) -> dict[str, Any]:
     """
     Purpose:
         Create a new secret dictionary by alternating username and generating new password.
 
     Flow Summary:
         1. Validate that 'password' field exists in current secret.
-        2. Create a copy of the current secret dictionary.
-        3. Get user names from environment variables.
-        4. Determine which user to alternate to (APP_USER_1 ↔ APP_USER_2).
-        5. Generate new password using get_random_password().
-        6. Return new secret dictionary.
+        2. Get user names from module configuration.
+        3. Determine which user to alternate to (APP_USER_1 ↔ APP_USER_2).
+        4. Build the new secret dictionary with the alternated username and
+           a password generated via get_random_password().
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
@@ -817,54 +1286,56 @@ def create_new_secret_value(service_client: BaseClient, current_secret: Dict[str
     if 'password' not in current_secret:
         raise KeyError("The 'password' field is required in current_secret")
 
-    # Copy the current secret
-    new_secret = current_secret.copy()
-    
     # Extract username from AWSCURRENT secret value
     current_username = current_secret.get('username', '')
-    
-    # Get user names from environment variables (required)
-    try:
-        user1 = os.environ[ENV_APP_USER_1]
-        user2 = os.environ[ENV_APP_USER_2]
-    except KeyError as e:
-        error_msg = (f"Required environment variable not set: {str(e)}. "
+
+    # Get user names from module-level config (required)
+    user1 = CONFIG.app_user_1
+    user2 = CONFIG.app_user_2
+    if not user1 or not user2:
+        error_msg = (f"Required environment variable not set. "
                     f"Please set {ENV_APP_USER_1} and {ENV_APP_USER_2} in Lambda configuration.")
         logger.error(error_msg)
         raise ValueError(error_msg)
-    
-    logger.info(f"Multi-user rotation strategy configured: {user1} ↔ {user2}")
-    
+
+    logger.info("Multi-user rotation strategy configured: %s ↔ %s", user1, user2)
+
     # Alternate between user1 and user2
-    if current_username == user1:
-        new_secret['username'] = user2
-        logger.info(f"Alternating username from {user1} to {user2}")
-    else:
-        new_secret['username'] = user1
-        logger.info(f"Alternating username from {user2} to {user1}")
-    
-    # Generate new password using get_random_password function()
-    new_secret['password'] = get_random_password(service_client)
-    logger.info(f"Generated new password for {new_secret['username']}")
-    
+    new_username = user2 if current_username == user1 else user1
+    logger.info("Alternating username from %s to %s", current_username or user2, new_username)
+
+    # Build the new secret in one expression - all other fields carry over
+    # unchanged, only username and password are replaced
+    new_secret = {
+        **current_secret,
+        'username': new_username,
+        'password': get_random_password(service_client),
+    }
+    logger.info("Generated new password for %s", new_username)
+
     return new_secret
 
 def get_random_password(service_client: BaseClient) -> str:
     """
     Purpose:
-        Generate a secure random password using get_random_password API.
+        Generate a secure random password locally using the secrets module
+        (OS CSPRNG), avoiding a Secrets Manager API round-trip per rotation.
 
     Flow Summary:
-        1. Read password length and excluded characters from environment variables.
-        2. Call get_random_password API with password policy parameters.
-        3. Return generated password string.
+        1. If USE_AWS_PASSWORD_GEN=1, call get_random_password API instead.
+        2. Draw characters from the precomputed policy pool with secrets.choice.
+        3. Re-draw until at least one character of each included class is
+           present (same guarantee as RequireEachIncludedType).
+        4. Return generated password string.
 
     Args:
-        service_client (BaseClient): Boto3 Secrets Manager client
+        service_client (BaseClient): Boto3 Secrets Manager client (only used
+            when USE_AWS_PASSWORD_GEN=1)
 
     Environment Variables:
         PASSWORD_LENGTH: Password length (default: 32)
         EXCLUDE_CHARACTERS: Characters to exclude (default: /@"'\\)
+        USE_AWS_PASSWORD_GEN: Set to 1 to use the Secrets Manager API instead
 
     Returns:
         str: Randomly generated password meeting the password policy
@@ -882,33 +1353,48 @@ def get_random_password(service_client: BaseClient) -> str:
 
     References:
         https://docs.aws.amazon.com/ja_jp/AmazonRDS/latest/AuroraUserGuide/Aurora.Modifying.html
+        https://docs.python.org/3/library/secrets.html
         https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetRandomPassword.html
     """
 
-    passwd = service_client.get_random_password(
-        PasswordLength=int(os.environ.get(ENV_PASSWORD_LENGTH, DEFAULT_PASSWORD_LENGTH)),
-        ExcludeCharacters=os.environ.get(ENV_EXCLUDE_CHARACTERS, DEFAULT_EXCLUDE_CHARACTERS),
-        ExcludeNumbers=False,
-        ExcludePunctuation=False,
-        ExcludeUppercase=False,
-        ExcludeLowercase=False,
-        IncludeSpace=False,
-        RequireEachIncludedType=True
-    )
-    return passwd['RandomPassword']
+    if _USE_AWS_PASSWORD_GEN:
+        # Server-side generation with the prebuilt password policy parameters
+        passwd = service_client.get_random_password(**_RANDOM_PASSWORD_PARAMS)
+        return passwd['RandomPassword']
+
+    # Rejection sampling: with a 32-character password the per-class
+    # requirement is satisfied on the first draw with overwhelming
+    # probability, so the loop almost never repeats. Each class's check is
+    # skipped if EXCLUDE_CHARACTERS removed that entire class, since the
+    # requirement would then be unsatisfiable and the loop could never exit.
+    while True:
+        password = ''.join(
+            secrets.choice(_PASSWORD_POOL) for _ in range(CONFIG.password_length)
+        )
+        if ((not _PASSWORD_UPPERCASE
+                     or any(c in _PASSWORD_UPPERCASE for c in password))
+                and (not _PASSWORD_LOWERCASE
+                     or any(c in _PASSWORD_LOWERCASE for c in password))
+                and (not _PASSWORD_DIGITS
+                     or any(c in _PASSWORD_DIGITS for c in password))
+                and (not _PASSWORD_PUNCTUATION
+                     or any(c in _PASSWORD_PUNCTUATION for c in password))):
+            return password
 
 def get_master_secret_with_fallback(
     service_client: BaseClient, 
     master_secret_arn: str, 
     retry_attempt: int = 0
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Purpose:
         Get master user credentials with fallback logic.
 
     Flow Summary:
-        1. Try to get AWSPENDING secret value of master user first.
-        2. If AWSPENDING secret value not found, fall back to AWSCURRENT secret value.
+        1. On a cache miss, check the (cached) describe_secret stage map for
+           an AWSPENDING version.
+        2. Fetch AWSPENDING if one exists (master rotation in progress),
+           otherwise fetch AWSCURRENT.
         3. Return master credentials dictionary.
 
     Args:
@@ -936,22 +1422,51 @@ def get_master_secret_with_fallback(
         Exception: For unexpected errors
     """
 
+    # Serve from the in-process TTL cache when possible - the master secret
+    # changes rarely and a cache hit avoids a Secrets Manager round-trip.
+    # set_secret() evicts this entry on authentication failures so retries
+    # during a concurrent master rotation always refetch fresh credentials.
+    cached = _MASTER_SECRET_CACHE.get(master_secret_arn)
+    if cached is not None:
+        expires_at, cached_secret = cached
+        if time.monotonic() < expires_at:
+            logger.info("Using cached master secret value [attempt %s]", retry_attempt + 1)
+            return cached_secret
+        _MASTER_SECRET_CACHE.pop(master_secret_arn, None)
+
     try:
-        # Try AWSPENDING secret value first (master rotation in progress)
-        try:
-            master_secret = get_secret(service_client, master_secret_arn, version_stage=VERSION_STAGE_PENDING)
-            logger.info(f"Got AWSPENDING secret value of master user (master rotation in progress) [attempt {retry_attempt + 1}]")
-            return master_secret
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                # AWSPENDING secret value not found - no master rotation in progress, fall back to AWSCURRENT secret value
-                logger.info(f"AWSPENDING secret value not found, using AWSCURRENT secret value (normal operation) [attempt {retry_attempt + 1}]")
-                master_secret = get_secret(service_client, master_secret_arn, version_stage=VERSION_STAGE_CURRENT)
-                return master_secret
-            else:
-                raise
+        # Ask the (cached) stage map whether an AWSPENDING version exists
+        # instead of probing with get_secret_value and catching
+        # ResourceNotFoundException - in the common no-rotation case that
+        # exception fired on every cache miss, and describe_secret is both
+        # cheaper (no KMS Decrypt) and usually already cached for this
+        # invocation. Auth-failure eviction also drops the describe cache, so
+        # retries see the master's current stage layout.
+        description = _describe_secret_cached(service_client, master_secret_arn)
+        pending_exists = any(
+            VERSION_STAGE_PENDING in stages
+            for stages in description.get('VersionIdsToStages', {}).values()
+        )
+
+        if pending_exists:
+            try:
+                master_secret = get_secret(service_client, master_secret_arn, None, VERSION_STAGE_PENDING)
+                logger.info("Got AWSPENDING secret value of master user (master rotation in progress) [attempt %s]", retry_attempt + 1)
+            except ClientError as e:
+                # The master's finishSecret can retire AWSPENDING between the
+                # describe and the fetch - fall through to AWSCURRENT
+                if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                    raise
+                pending_exists = False
+
+        if not pending_exists:
+            master_secret = get_secret(service_client, master_secret_arn, None, VERSION_STAGE_CURRENT)
+            logger.info("No AWSPENDING version on master, using AWSCURRENT secret value (normal operation) [attempt %s]", retry_attempt + 1)
+
+        _MASTER_SECRET_CACHE[master_secret_arn] = (time.monotonic() + DEFAULT_MASTER_SECRET_CACHE_TTL, master_secret)
+        return master_secret
     except Exception as e:
-        logger.error(f"Error retrieving master user credentials: {str(e)}")
+        logger.error("Error retrieving master user credentials: %s", str(e))
         raise
 
 def create_tls_connection(host: str, port: int, username: str, password: str) -> pymysql.Connection:
@@ -974,10 +1489,10 @@ def create_tls_connection(host: str, port: int, username: str, password: str) ->
         DB_CA_BUNDLE_PATH: Path to CA certificate bundle (optional)
 
     SSL/TLS Configuration:
-        - If DB_CA_BUNDLE_PATH is set and file exists:
-          Uses explicit CA certificate with VERIFY_IDENTITY mode (full validation)
-        - Otherwise:
-          Uses system default CA certificates with certificate verification (recommended)
+        - Uses the module-level _SSL_CONTEXT built once at cold start:
+          explicit CA bundle when DB_CA_BUNDLE_PATH is set and exists,
+          otherwise the system default CA certificates (recommended)
+        - Certificate and hostname verification are always enabled
 
     Returns:
         pymysql.Connection: Established database connection with SSL/TLS
@@ -992,10 +1507,11 @@ def create_tls_connection(host: str, port: int, username: str, password: str) ->
         https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/UsingWithRDS.SSL.html
     """
 
-    # Check if CA certificate bundle path is specified via environment variable
-    ca_bundle_path = os.environ.get(ENV_DB_CA_BUNDLE_PATH)
-    
-    # Base connection parameters
+    # First database touch on this code path - bind the lazy pymysql import
+    _load_pymysql()
+
+    # Connection parameters - the SSL context is prebuilt at module import
+    # (_SSL_CONTEXT), so the CA bundle is not re-read on every connect
     connection_params = {
         'host': host,
         'port': port,
@@ -1004,58 +1520,147 @@ def create_tls_connection(host: str, port: int, username: str, password: str) ->
         'connect_timeout': DEFAULT_CONNECTION_TIMEOUT,
         'read_timeout': DEFAULT_CONNECTION_TIMEOUT,
         'write_timeout': DEFAULT_CONNECTION_TIMEOUT,
-        'ssl_disabled': False,  # Enable SSL/TLS
-        'ssl_verify_cert': True,  # Verify server certificate
-        'ssl_verify_identity': True  # Verify hostname matches certificate
+        'ssl': _SSL_CONTEXT,  # Enables SSL/TLS with certificate + hostname verification
+        # Explicit: all SQL within one set_secret attempt shares this
+        # connection and is committed once at the end (pymysql default,
+        # stated here so the single-transaction contract is visible)
+        'autocommit': False,
+        # Lets clone_user_privileges() send all cloned GRANTs in one round-trip
+        'client_flag': CLIENT.MULTI_STATEMENTS
     }
-    
-    # Two SSL/TLS connection modes based on CA certificate availability
-    # Mode 1: Use explicit CA certificate path (custom CA or specific AWS RDS CA bundle version)
-    #         Set DB_CA_BUNDLE_PATH environment variable to specify certificate path
-    #         Typical use case: Private CA, corporate CA, or certificate version control
-    if ca_bundle_path and os.path.exists(ca_bundle_path):
-        logger.info(f"Using SSL with explicit CA bundle: {ca_bundle_path}")
-        connection_params['ssl_ca'] = ca_bundle_path
-    # Mode 2: Use system default CA certificates (includes AWS RDS CA bundle)
-    #         Recommended for standard AWS environments - no configuration needed
-    else:
-        logger.info("Using SSL with system default CA certificates")
-    
-    return pymysql.connect(**connection_params)
 
-def user_exists(cursor: Any, username: str) -> bool:
+    conn = pymysql.connect(**connection_params)
+
+    # pymysql already disables Nagle (TCP_NODELAY) on connect; additionally
+    # enable SO_KEEPALIVE so pooled connections surviving idle gaps between
+    # warm invocations are detected as dead by the kernel rather than only at
+    # the next failed query. Best effort - the socket handle is private API.
+    sock = getattr(conn, '_sock', None)
+    if sock is not None:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+
+    return conn
+
+# Database connections pooled across warm Lambda invocations, keyed by the
+# credentials that opened them. Reusing a socket skips the TCP + TLS + MySQL
+# auth round-trips (~50-200ms on RDS). A rotated password changes the key, so
+# stale entries are simply never borrowed again.
+_CONN_POOL: dict[tuple, pymysql.Connection] = {}  # (host, port, user, password-hash) -> conn
+
+def get_master_conn(host: str, port: int, username: str, password: str) -> pymysql.Connection:
     """
     Purpose:
-        Check if a database user exists in the MySQL user table.
+        Get a live database connection from the in-process pool, reusing
+        existing ones across warm Lambda invocations when possible. Used for
+        the master connection in set_secret and the verification connection
+        in test_database_connection.
 
     Flow Summary:
-        1. Execute SELECT COUNT query on mysql.user table.
-        2. Check if count is greater than 0.
-        3. Return True if user exists, False otherwise.
+        1. If a pooled connection exists for the same credentials, verify it
+           with ping(reconnect=True) and return it.
+        2. If the ping fails, drop that pooled connection.
+        3. Otherwise establish a new SSL/TLS connection and pool it.
 
     Args:
-        cursor: Database cursor object (pymysql cursor)
-        username (str): Username to check
+        host (str): Database host address
+        port (int): Database port number
+        username (str): Database user name
+        password (str): Database password
 
     Returns:
-        bool: True if user exists, False otherwise
+        pymysql.Connection: Established (possibly reused) database connection
 
     Raises:
-        Exception: If database query fails
+        pymysql.err.OperationalError: If connection fails
+    """
 
-    References:
-        https://docs.aws.amazon.com/secretsmanager/latest/userguide/rotation-strategy.html
+    key = (host, port, username, hash(password))
+    conn = _CONN_POOL.get(key)
+    if conn is not None:
+        try:
+            conn.ping(reconnect=True)
+            return conn
+        except Exception:
+            logger.info("Pooled connection for user '%s' is no longer usable, reconnecting", username)
+            _CONN_POOL.pop(key, None)
+            try:
+                conn.close()
+            except Exception:
+                pass  # Already broken - nothing useful to do
+
+    conn = create_tls_connection(host, port, username, password)
+    _CONN_POOL[key] = conn
+    return conn
+
+def drop_master_conn() -> None:
+    """Close and forget all pooled connections (used on terminal errors)."""
+    for conn in _CONN_POOL.values():
+        try:
+            conn.close()
+        except Exception:
+            pass  # Already broken - nothing useful to do
+    _CONN_POOL.clear()
+
+# Lambda freezes rather than exits in normal operation, but close the pool
+# cleanly when the runtime does shut down (SIGTERM-driven interpreter exit)
+atexit.register(drop_master_conn)
+
+def wait_for_propagation(host: str, port: int, username: str, password: str, max_wait: int = DEFAULT_DB_WAIT_TIME) -> None:
     """
+    Purpose:
+        Wait until a freshly set password is accepted by the database,
+        returning as soon as propagation completes instead of sleeping a
+        fixed interval.
 
-    try:
-        cursor.execute("SELECT COUNT(*) FROM mysql.user WHERE user = %s", (username,))
-        result = cursor.fetchone()
-        exists = result[0] > 0
-        logger.info(f"User '{username}' exists: {exists}")
-        return exists
-    except Exception as e:
-        logger.error(f"Error checking if user '{username}' exists: {str(e)}")
-        raise
+    Flow Summary:
+        1. Attempt an SSL/TLS connection with the new credentials.
+        2. On success, return immediately (propagation confirmed).
+        3. On authentication error (1045), sleep with exponential backoff
+           (starting at 100ms) and retry until max_wait is exhausted.
+
+    Args:
+        host (str): Database host address
+        port (int): Database port number
+        username (str): User whose password was just changed
+        password (str): The newly set password
+        max_wait (int, optional): Upper bound in seconds (default: 5)
+
+    Returns:
+        None: Always returns; an unconfirmed propagation is only logged
+              because test_secret retries connectivity afterwards anyway.
+
+    Note:
+        Propagation usually completes in under a second, so the probe cuts
+        the median rotation wall time while keeping the worst case at the
+        same max_wait the previous fixed sleep used.
+    """
+
+    # Bind pymysql before the try block - its except clauses reference it
+    _load_pymysql()
+
+    deadline = time.monotonic() + max_wait
+    delay = 0.1
+    while True:
+        try:
+            conn = create_tls_connection(host, port, username, password)
+            conn.close()
+            logger.info("New password for user '%s' is active", username)
+            return
+        except pymysql.err.OperationalError as e:
+            error_code = e.args[0] if e.args else None
+            remaining = deadline - time.monotonic()
+            if error_code != MYSQL_ERROR_ACCESS_DENIED or remaining <= 0:
+                # Wait budget exhausted or a non-auth failure - leave final
+                # verification to test_secret's retry logic
+                logger.warning("Password propagation not confirmed within %s seconds: %s", max_wait, str(e))
+                return
+            time.sleep(min(delay, remaining))
+            # Cap the interval at 500ms so propagation completing late in the
+            # budget is still detected within half a second
+            delay = min(delay * 2, 0.5)
 
 def clone_user_privileges(cursor: Any, source_username: str, target_username: str, database_name: Optional[str] = None) -> None:
     """
@@ -1104,29 +1709,30 @@ def clone_user_privileges(cursor: Any, source_username: str, target_username: st
     
     # Clone all privileges from source user to target user
     try:
-        logger.info(f"Cloning privileges from '{source_username}' to '{target_username}'")
+        logger.info("Cloning privileges from '%s' to '%s'", source_username, target_username)
         
         # Get all GRANT statements for source user (only host '%' is supported)
-        cursor.execute("SHOW GRANTS FOR %s@'%%'", (source_username,))
+        cursor.execute(_SQL_SHOW_GRANTS, (source_username,))
         grants = cursor.fetchall()
         
         if not grants:
-            logger.warning(f"No grants found for user '{source_username}'")
+            logger.warning("No grants found for user '%s'", source_username)
             return
         
-        # Parse each GRANT statement and apply to the target user
-        for grant in grants:
-            grant_statement = grant[0]
-            logger.debug(f"Processing grant statement: {grant_statement}")
-            
-            # Skip default GRANT statements that don't need cloning (GRANT USAGE ON *.*) using should_skip_grant()
-            if should_skip_grant(grant_statement):
-                logger.debug(f"Skipping USAGE grant (default privilege): {grant_statement}")
-                continue # Skip processing this grant and move to next grant_statement 
-            
+        # Drop default USAGE grants up front with the precompiled filter so
+        # the parse loop below only touches statements that must be cloned
+        statements = [grant[0] for grant in grants if not should_skip_grant(grant[0])]
+        if not statements:
+            logger.info("Only default USAGE grants found for user '%s', nothing to clone", source_username)
+            return
+
+        # Parse each GRANT statement and collect the rewritten versions so
+        # they can be sent to the server in a single batch below
+        target_grants = []
+        for grant_statement in statements:
             # Parse the GRANT statement with regex (regular expression) using parse_grant_statement()
             parsed = parse_grant_statement(grant_statement)
-            
+
             # Raise error if parse failed
             if not parsed:
                 error_msg = f"Failed to parse GRANT statement: {grant_statement}"
@@ -1138,11 +1744,23 @@ def clone_user_privileges(cursor: Any, source_username: str, target_username: st
             if parsed['additional_clauses']:
                 target_grant = f"{target_grant} {parsed['additional_clauses']}"
             
-            logger.info(f"Applying grant: {target_grant}")
-            # Execute new GRANT statement for target user
-            cursor.execute(target_grant)
-        
-        logger.info(f"Successfully cloned all privileges from '{source_username}' to '{target_username}'")
+            logger.debug("Applying grant: %s", target_grant)
+            target_grants.append(target_grant)
+
+        # Execute all cloned GRANTs in one multi-statement round-trip instead
+        # of one per grant (the connection sets CLIENT.MULTI_STATEMENTS).
+        # No explicit transaction: GRANT implicitly commits in MySQL, so a
+        # wrapper would not make the batch atomic anyway.
+        if target_grants:
+            # One summary log line instead of one per grant - users with many
+            # grants otherwise amplify CloudWatch volume per rotation
+            logger.info("Applying %s cloned grant(s) to '%s' in one batch", len(target_grants), target_username)
+            cursor.execute('; '.join(target_grants))
+            # Drain the per-statement result sets so the connection is clean
+            while cursor.nextset():
+                pass
+
+        logger.info("Successfully cloned all privileges from '%s' to '%s'", source_username, target_username)
         
     except Exception as e:
         # Handle initial setup: source user doesn't exist yet
@@ -1151,8 +1769,8 @@ def clone_user_privileges(cursor: Any, source_username: str, target_username: st
         # MySQL error 1141: "There is no such grant defined for user 'X' on hostname 'Y'"
         # This occurs on first rotation when source user doesn't exist in database
         if "There is no such grant defined" in error_message or "1141" in error_message:
-            logger.warning(f"Source user '{source_username}' does not exist in database. This appears to be initial setup.")
-            logger.info(f"Applying default privileges to '{target_username}' instead of cloning from non-existent user")
+            logger.warning("Source user '%s' does not exist in database. This appears to be initial setup.", source_username)
+            logger.info("Applying default privileges to '%s' instead of cloning from non-existent user", target_username)
             
             # Validate that database_name is provided from secret
             if not database_name:
@@ -1161,29 +1779,37 @@ def clone_user_privileges(cursor: Any, source_username: str, target_username: st
             
             target_database = database_name
             default_privileges = DEFAULT_APP_PRIVILEGES
-            
-            # Apply default privileges to target user
-            grant_sql = f"GRANT {default_privileges} ON {target_database}.* TO %s@'%%'"
-            logger.info(f"Executing default grant: {grant_sql.replace('%s', repr(target_username))}")
+
+            # Database name comes from the secret and cannot be parameterized
+            # in a GRANT - validate it before formatting into the template
+            if not _IDENTIFIER_RE.match(target_database):
+                raise ValueError(f"Invalid database name for privilege grant: {target_database!r}")
+
+            # Apply default privileges to target user. No FLUSH PRIVILEGES:
+            # GRANT/CREATE USER statements take effect immediately - flushing
+            # is only needed after editing the mysql.* tables directly, so the
+            # extra round-trip bought nothing.
+            grant_sql = _SQL_DEFAULT_GRANT.format(privileges=default_privileges, database=target_database)
+            logger.info("Executing default grant: %s", grant_sql.replace('%s', repr(target_username)))
             cursor.execute(grant_sql, (target_username,))
-            
-            # Flush privileges to ensure changes take effect immediately
-            cursor.execute("FLUSH PRIVILEGES")
-            
-            logger.info(f"Successfully applied default privileges ({default_privileges}) to '{target_username}' on database '{target_database}'")
-            logger.warning(f"Note: Default privileges were used for initial setup. "
-                          f"Subsequent rotations will clone privileges from existing users.")
+
+            logger.info("Successfully applied default privileges (%s) to '%s' on database '%s'", default_privileges, target_username, target_database)
+            logger.warning("Note: Default privileges were used for initial setup. "
+                          "Subsequent rotations will clone privileges from existing users.")
             
             return
         
         # For other errors, re-raise
-        logger.error(f"Error cloning privileges: {error_message}")
+        logger.error("Error cloning privileges: %s", error_message)
         raise
 
+@lru_cache(maxsize=512)
 def should_skip_grant(grant_statement: str) -> bool:
     """
     Purpose:
         Check if a GRANT statement is a default privilege (GRANT USAGE ON *.*).
+        Memoized - the result is a pure function of the statement text, and
+        grant sets repeat across rotations in the same warm container.
 
     Args:
         grant_statement (str): The GRANT statement to check
@@ -1197,9 +1823,9 @@ def should_skip_grant(grant_statement: str) -> bool:
     """
 
     # Skip GRANT USAGE ON *.* (default privilege with no real permissions)
-    return "GRANT USAGE ON *.*" in grant_statement.upper()
+    return _SKIP_RE.match(grant_statement) is not None
 
-def parse_grant_statement(grant_statement: str) -> Optional[Dict[str, str]]:
+def parse_grant_statement(grant_statement: str) -> Optional[dict[str, str]]:
     """
     Purpose:
         Parse a GRANT statement using regex (regular expression).
@@ -1229,11 +1855,8 @@ def parse_grant_statement(grant_statement: str) -> Optional[Dict[str, str]]:
         }
     """
 
-    import re
-    
-    pattern = r"(GRANT .+?)\s+TO\s+['\"]?(\w+)['\"]?@['\"]?([^'\"]+)['\"]?(.*?)(?:;)?$"
-    match = re.match(pattern, grant_statement, re.IGNORECASE)
-    
+    match = _GRANT_RE.match(grant_statement)
+
     if not match:
         return None
     
@@ -1251,9 +1874,10 @@ def test_database_connection(host: str, port: int, username: str, password: str)
 
     Flow Summary:
         1. Validate required parameters (host, port, username, password).
-        2. Establish SSL/TLS connection using create_tls_connection().
-        3. Execute simple query (SELECT 1) to verify connection.
-        4. Close connection and return success.
+        2. Borrow an SSL/TLS connection from the in-process pool - the auth
+           handshake (fresh connect) or COM_PING (reused connection) already
+           verifies liveness, so no extra query is sent.
+        3. Leave the connection pooled for reuse and return success.
 
     Args:
         host (str): Database host address (e.g., cluster.region.rds.amazonaws.com)
@@ -1291,16 +1915,19 @@ def test_database_connection(host: str, port: int, username: str, password: str)
     # Raise error if port is not an integer type or port <= 0
     if not isinstance(port, int) or port <= 0:
         raise ValueError(f"Invalid port number: {port}")
-    
+
+    # Bind pymysql before the try block - its except clauses reference it
+    _load_pymysql()
+
     try:
-        # Establish connection using helper function
-        with create_tls_connection(host, port, username, password) as conn:
-            # Execute simple query to verify connection works
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
-                cur.fetchone()
-        
-        logger.info(f"Database connection test successful for user: {username}")
+        # Borrow from the connection pool - kept open on success so retries
+        # and later steps reuse the socket instead of re-handshaking. The
+        # borrow itself proves the credentials: a fresh connect completes the
+        # full MySQL auth handshake and a reused connection is verified with
+        # COM_PING, so a follow-up SELECT 1 would be a redundant round-trip.
+        get_master_conn(host, port, username, password)
+
+        logger.info("Database connection test successful for user: %s", username)
         return True
         
     except pymysql.err.OperationalError as e:
@@ -1311,28 +1938,28 @@ def test_database_connection(host: str, port: int, username: str, password: str)
         if error_code in (MYSQL_ERROR_ACCESS_DENIED, MYSQL_ERROR_ACCESS_DENIED_DB):
             # 1045: Access denied (wrong password or user doesn't exist)
             # 1044: Access denied to database (insufficient privileges)
-            logger.error(f"Authentication failed for user {username}: {str(e)}")
+            logger.error("Authentication failed for user %s: %s", username, str(e))
         
         # Connection errors (error codes: 2003, 2005, 2006)
         elif error_code in (MYSQL_ERROR_CONNECTION_REFUSED, MYSQL_ERROR_UNKNOWN_HOST, MYSQL_ERROR_SERVER_GONE):
             # 2003: Cannot connect (connection refused, firewall, wrong port)
             # 2005: Unknown host (DNS resolution failure)
             # 2006: Server has gone away (connection lost)
-            logger.error(f"Cannot connect to database at {host}:{port}: {str(e)}")
+            logger.error("Cannot connect to database at %s:%s: %s", host, port, str(e))
         
         # Other operational errors
         else:
-            logger.error(f"Database operational error: {str(e)}")
+            logger.error("Database operational error: %s", str(e))
         raise
     
     except pymysql.err.MySQLError as e:
         # Handle other MySQL-specific errors (SQL syntax, query execution, etc.)
-        logger.error(f"MySQL error during connection test: {str(e)}")
+        logger.error("MySQL error during connection test: %s", str(e))
         raise
     
     except Exception as e:
         # Handle unexpected errors (network issues, SSL/TLS problems, etc.)
-        logger.error(f"Unexpected error during database connection test: {str(e)}", exc_info=True)
+        logger.error("Unexpected error during database connection test: %s", str(e))
         raise
 
 def get_current_version(service_client: BaseClient, arn: str) -> Optional[str]:
@@ -1341,10 +1968,9 @@ def get_current_version(service_client: BaseClient, arn: str) -> Optional[str]:
         Get the current version ID (AWSCURRENT stage) from Secrets Manager.
 
     Flow Summary:
-        1. Call describe_secret API to get secret metadata.
-        2. Loop through VersionIdsToStages dictionary.
-        3. Find version ID that has AWSCURRENT label.
-        4. Return version ID, or None if AWSCURRENT not found.
+        1. Call describe_secret API to get secret metadata (cached).
+        2. Pick the version ID carrying the AWSCURRENT label from
+           VersionIdsToStages, or None if no version has it.
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
@@ -1367,17 +1993,42 @@ def get_current_version(service_client: BaseClient, arn: str) -> Optional[str]:
     """
 
     try:
-        response = service_client.describe_secret(SecretId=arn)
-        
-        # Find version ID that has AWSCURRENT label
-        for version_id, stages in response.get('VersionIdsToStages', {}).items():
-            # If AWSCURRENT label is found, return version ID
-            if VERSION_STAGE_CURRENT in stages:
-                return version_id
-        
-        # If AWSCURRENT label is not found, return None
-        return None
+        # Reuse the short-lived describe cache - Secrets Manager replays
+        # finishSecret aggressively and the stage map rarely changes between
+        # replays (the promote path invalidates the entry explicitly)
+        response = _describe_secret_cached(service_client, arn)
+
+        # Find the version ID carrying the AWSCURRENT label (None if absent).
+        # A get_secret_value lookup would return the ID too, but costs a KMS
+        # Decrypt for a payload this function never reads.
+        return next(
+            (version_id
+             for version_id, stages in response.get('VersionIdsToStages', {}).items()
+             if VERSION_STAGE_CURRENT in stages),
+            None,
+        )
         
     except Exception as e:
-        logger.error(f"Error in get_current_version for {arn}: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("Error in get_current_version for %s: %s", arn, str(e))
+        raise
+
+# ============================================================================
+# Cold Start Pre-warming
+# ============================================================================
+# The first GetSecretValue per container pays the KMS permission evaluation
+# and session establishment for the secret's key. Doing it once during the
+# Lambda init phase moves that cost out of the billed handler invocation and
+# leaves the master secret sitting in the TTL caches for the first rotation
+# step. Guarded so importing the module outside Lambda stays side-effect free,
+# and best-effort: a failure here must not break the container.
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') and CONFIG.master_secret_arn:
+    try:
+        _warm_master_secret = get_secret(SERVICE_CLIENT, CONFIG.master_secret_arn, None, VERSION_STAGE_CURRENT)
+        _MASTER_SECRET_CACHE[CONFIG.master_secret_arn] = (
+            time.monotonic() + DEFAULT_MASTER_SECRET_CACHE_TTL,
+            _warm_master_secret,
+        )
+        del _warm_master_secret
+        logger.info("Pre-warmed master secret fetch during init")
+    except Exception as e:
+        logger.warning("Master secret pre-warm failed (will fetch on demand): %s", e)
\ No newline at end of file
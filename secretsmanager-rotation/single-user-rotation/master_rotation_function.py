@@ -1,18 +1,39 @@
 # Standard library (Python built-in modules)
+import atexit
 import json
 import logging
 import os
+import random
+import socket
+import ssl
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 
 # External library (Pre-installed in AWS Lambda runtime environment)
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from botocore.client import BaseClient
 
 # External library
 import pymysql
 
+# External library (optional) - Rust-based JSON codec, 2-5x faster than the
+# stdlib. Declared in requirements.txt; fall back to stdlib json so a
+# deployment package built without the wheel still rotates correctly.
+try:
+    import orjson
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    _json_loads = orjson.loads
+except ImportError:
+    # Compact separators: the SecretString is machine-read only, and every
+    # byte saved is encrypted/decrypted by KMS on each access for the rest of
+    # the secret's life (orjson above is compact by default)
+    _json_dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    _json_loads = json.loads
+
 # ============================================================================
 # Configuration and Constants
 # ============================================================================
@@ -27,6 +48,7 @@ ENV_RDS_PASSWORD_PROPAGATION_WAIT = 'RDS_PASSWORD_PROPAGATION_WAIT'
 ENV_DB_CONNECTION_TEST_RETRIES = 'DB_CONNECTION_TEST_RETRIES'
 ENV_DB_CONNECTION_TEST_RETRY_DELAY = 'DB_CONNECTION_TEST_RETRY_DELAY'
 ENV_DB_CA_BUNDLE_PATH = 'DB_CA_BUNDLE_PATH'
+ENV_SECRET_CACHE_TTL = 'SECRET_CACHE_TTL'
 
 # Default values
 DEFAULT_PASSWORD_LENGTH = 32
@@ -35,6 +57,15 @@ DEFAULT_RDS_WAIT_TIME = 10
 DEFAULT_CONNECTION_RETRIES = 3
 DEFAULT_RETRY_DELAY = 5
 DEFAULT_CONNECTION_TIMEOUT = 30
+DEFAULT_SECRET_CACHE_TTL = 60
+# Tight timeout for the testSecret probes - a failed attempt should return
+# fast so the retry loop gets more attempts within the Lambda budget instead
+# of hanging on one connect for the full default timeout
+DEFAULT_CONNECTION_TEST_TIMEOUT = 3
+
+# Safety margin kept between the last retry sleep and the Lambda timeout, so
+# the function fails with a useful error instead of being killed mid-attempt
+DEADLINE_BUFFER_SECONDS = 5.0
 
 # MySQL Error Codes
 MYSQL_ERROR_ACCESS_DENIED = 1045
@@ -43,10 +74,179 @@ MYSQL_ERROR_CONNECTION_REFUSED = 2003
 MYSQL_ERROR_UNKNOWN_HOST = 2005
 MYSQL_ERROR_SERVER_GONE = 2006
 
+# Error-code groups for the OperationalError handler in
+# test_database_connection - a frozenset membership test is a single C-level
+# hash lookup, and naming the groups keeps the handler branches readable
+_MYSQL_AUTH_ERRORS = frozenset({MYSQL_ERROR_ACCESS_DENIED, MYSQL_ERROR_ACCESS_DENIED_DB})
+_MYSQL_CONNECTION_ERRORS = frozenset({
+    MYSQL_ERROR_CONNECTION_REFUSED,
+    MYSQL_ERROR_UNKNOWN_HOST,
+    MYSQL_ERROR_SERVER_GONE
+})
+
+# Error code -> log template for the handler, built from the groups above.
+# %(name)s-style templates let logging format lazily, only when the record
+# is actually emitted; unknown codes fall back to the generic template.
+_MYSQL_ERROR_LOG_TEMPLATES = {
+    # 1045: Access denied (wrong password or user doesn't exist)
+    # 1044: Access denied to database (insufficient privileges)
+    **{code: 'Authentication failed for user %(username)s: %(error)s'
+       for code in _MYSQL_AUTH_ERRORS},
+    # 2003: Cannot connect (connection refused, firewall, wrong port)
+    # 2005: Unknown host (DNS resolution failure)
+    # 2006: Server has gone away (connection lost)
+    **{code: 'Cannot connect to database at %(host)s:%(port)s: %(error)s'
+       for code in _MYSQL_CONNECTION_ERRORS},
+}
+
+# Throttling-style codes the propagation poller may retry; any other
+# ClientError (e.g. AccessDenied from a role missing rds:DescribeDBClusters)
+# cannot start succeeding mid-loop, so the poller gives up on it immediately
+_TRANSIENT_RDS_POLL_ERRORS = frozenset({'Throttling', 'ThrottlingException', 'RequestLimitExceeded'})
+
 # Secrets Manager version stages
 VERSION_STAGE_CURRENT = 'AWSCURRENT'
 VERSION_STAGE_PENDING = 'AWSPENDING'
 
+# CA certificate bundle - resolved once at module load. The path is fixed per
+# deployment, so re-checking os.path.exists() on every database connection
+# repeated a stat() syscall for an answer that never changes.
+_CA_BUNDLE_PATH = os.environ.get(ENV_DB_CA_BUNDLE_PATH)
+_CA_BUNDLE_VALID = bool(_CA_BUNDLE_PATH) and os.path.exists(_CA_BUNDLE_PATH)
+
+# TLS context built once at module load and reused by every database
+# connection. Building a context parses the CA bundle PEM (file I/O + X.509
+# decoding); doing that per connect repeated the work on every testSecret
+# probe. check_hostname + CERT_REQUIRED reproduce the previous
+# ssl_verify_cert/ssl_verify_identity behavior exactly.
+_SSL_CONTEXT = ssl.create_default_context(cafile=_CA_BUNDLE_PATH if _CA_BUNDLE_VALID else None)
+_SSL_CONTEXT.check_hostname = True
+_SSL_CONTEXT.verify_mode = ssl.CERT_REQUIRED
+
+# Numeric tuning knobs resolved once at import. Lambda environment variables
+# are fixed for the container's lifetime, so re-reading os.environ and
+# re-running int() on every invocation repeated work whose answer never changes.
+_RDS_WAIT = int(os.environ.get(ENV_RDS_PASSWORD_PROPAGATION_WAIT, DEFAULT_RDS_WAIT_TIME))
+_DB_RETRIES = int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRIES, DEFAULT_CONNECTION_RETRIES))
+_DB_RETRY_DELAY = int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRY_DELAY, DEFAULT_RETRY_DELAY))
+_PASSWORD_LENGTH = int(os.environ.get(ENV_PASSWORD_LENGTH, DEFAULT_PASSWORD_LENGTH))
+_EXCLUDE_CHARS = os.environ.get(ENV_EXCLUDE_CHARACTERS, DEFAULT_EXCLUDE_CHARACTERS)
+
+# Password-policy arguments for get_random_password, frozen at module load -
+# every field is constant for the container's lifetime, so rebuilding the
+# eight keyword arguments on each call was pure overhead
+_PW_KWARGS = {
+    'PasswordLength': _PASSWORD_LENGTH,
+    'ExcludeCharacters': _EXCLUDE_CHARS,
+    'ExcludeNumbers': False,
+    'ExcludePunctuation': False,
+    'ExcludeUppercase': False,
+    'ExcludeLowercase': False,
+    'IncludeSpace': False,
+    'RequireEachIncludedType': True
+}
+
+# Hosts whose successful connection test has already been logged in this
+# container. Every CloudWatch log byte is billed and the testSecret retry
+# loop can probe the same host several times per rotation, so the success
+# line is emitted once per host instead of per call.
+_LOGGED_HOSTS: set = set()
+
+# Live database connections reused across warm invocations, keyed by
+# (host, port, user, password-hash) so a rotated password never matches a
+# stale session. setSecret's propagation check and testSecret's retry loop
+# probe the same endpoint repeatedly; reusing the session skips the TCP + TLS
+# handshake (~100ms against RDS) on every probe after the first.
+_CONN_CACHE: Dict[Any, Any] = {}
+
+def _close_cached_connections() -> None:
+    """Close cached database connections when the runtime shuts down."""
+    for conn in _CONN_CACHE.values():
+        try:
+            conn.close()
+        except Exception:
+            pass  # Shutdown path - connection may already be gone
+    _CONN_CACHE.clear()
+
+atexit.register(_close_cached_connections)
+
+# One explicit boto3 session shared by every client in this module. Each
+# boto3.client() call otherwise resolves credentials and region through the
+# (lazily created) default session; a single named session makes the sharing
+# explicit and keeps all clients on the same credential cache.
+_SESSION = boto3.session.Session()
+
+# Shared botocore configuration for all AWS clients in this module. Adaptive
+# retry mode throttles client-side when the account-level Secrets Manager API
+# quota is contended - i.e. when many rotation Lambdas run in parallel.
+_CLIENT_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=3,
+    read_timeout=10,
+    max_pool_connections=4,
+    tcp_keepalive=True
+)
+
+# Secrets Manager client - created once at module load (cold start) and reused
+# across warm invocations so botocore's HTTPS connection pool (and its TLS
+# session) is not rebuilt on every rotation call. tcp_keepalive keeps the
+# pooled socket alive between steps; the tight connect timeout bounds cold paths.
+# Credentials are retrieved in order: Environment variables → AWS config files → IAM role(Lambda execution role)
+_SM_CLIENT = _SESSION.client('secretsmanager', config=_CLIENT_CONFIG)
+
+def get_service_client() -> BaseClient:
+    """Return the shared module-level Secrets Manager client."""
+    return _SM_CLIENT
+
+# RDS client - only setSecret needs it, so it is created lazily on first use
+# rather than at cold start, then cached for the rest of the container's life.
+# Every step shares the same cold start, so eagerly building a client that
+# three of the four steps never touch would just lengthen it.
+_RDS_CLIENT: Optional[BaseClient] = None
+
+def get_rds_client() -> BaseClient:
+    """Return the shared RDS client, creating it on first use."""
+    global _RDS_CLIENT
+    if _RDS_CLIENT is None:
+        _RDS_CLIENT = _SESSION.client('rds', config=_CLIENT_CONFIG)
+    return _RDS_CLIENT
+
+# Short-TTL cache for describe_secret responses, keyed by ARN. Both
+# create_secret's skip-probe and get_current_version read the same
+# VersionIdsToStages metadata, so sharing one response per invocation saves a
+# DescribeSecret call. The TTL is short because stage labels move during
+# rotation; finish_secret also evicts explicitly after promoting AWSPENDING.
+_DESCRIBE_CACHE: Dict[str, Any] = {}
+DESCRIBE_CACHE_TTL = 5
+
+def _describe_secret_cached(service_client: BaseClient, arn: str) -> Dict[str, Any]:
+    """Return describe_secret metadata for the ARN, cached for a few seconds."""
+    cached = _DESCRIBE_CACHE.get(arn)
+    if cached is not None:
+        expires_at, response = cached
+        if time.monotonic() < expires_at:
+            return response
+        _DESCRIBE_CACHE.pop(arn, None)
+
+    response = service_client.describe_secret(SecretId=arn)
+    _DESCRIBE_CACHE[arn] = (time.monotonic() + DESCRIBE_CACHE_TTL, response)
+    return response
+
+# TTL cache for decrypted secret values, keyed by (arn, token, stage). The
+# four rotation steps usually run back-to-back in the same warm container and
+# each re-fetched (and re-decrypted via KMS) values that cannot have changed
+# mid-rotation. create_secret seeds the AWSPENDING entry it just wrote;
+# finish_secret evicts everything for the ARN once the stage labels move.
+_SECRET_CACHE: Dict[Any, Any] = {}
+# TTL in seconds; set SECRET_CACHE_TTL=0 to disable value caching entirely
+SECRET_CACHE_TTL = int(os.environ.get(ENV_SECRET_CACHE_TTL, DEFAULT_SECRET_CACHE_TTL))
+
+def _invalidate_secret_cache(arn: str) -> None:
+    """Evict all cached secret values (and describe metadata) for an ARN."""
+    for key in [k for k in _SECRET_CACHE if k[0] == arn]:
+        _SECRET_CACHE.pop(key, None)
+    _DESCRIBE_CACHE.pop(arn, None)
+
 # ============================================================================
 # AWS Lambda Handler (First function called by AWS Secrets Manager)
 # ============================================================================
@@ -56,6 +256,16 @@ VERSION_STAGE_PENDING = 'AWSPENDING'
 # ============================================================================
 # Rotation Flow (Single-User Strategy)
 # ============================================================================
+# NOTE: The single-user strategy inherently needs the propagation wait in
+# setSecret, because the one set of credentials applications use is the same
+# one being changed through the RDS control plane. Where rotation latency
+# matters, prefer the multi-user strategy implemented in
+# ../multi-user-rotation/app_rotation_function.py: it alternates two
+# application users via direct ALTER USER, so there is no modify_db_cluster
+# call, no cluster state transition, and no propagation wait. This function
+# stays single-user on purpose - it rotates the master credential itself,
+# which cannot be duplicated into a second user.
+#
 # Step 1: createSecret
 #   - Get AWSCURRENT secret value
 #   - Generate new password
@@ -64,7 +274,7 @@ VERSION_STAGE_PENDING = 'AWSPENDING'
 # Step 2: setSecret
 #   - Get AWSCURRENT and AWSPENDING secret values
 #   - Update RDS master password via modify_db_cluster API
-#   - Wait for RDS password propagation (default: 10 seconds)
+#   - Poll cluster until the password change is applied (max: 10 seconds)
 #
 # Step 3: testSecret
 #   - Get AWSPENDING secret value
@@ -83,6 +293,43 @@ VERSION_STAGE_PENDING = 'AWSPENDING'
 # 4. pymysql.err.MySQLError: General MySQL errors
 # 5. Exception: Catch-all for unexpected errors
 
+def _emit_step_metric(step: str, arn: str, elapsed_ms: float, success: bool) -> None:
+    """
+    Purpose:
+        Emit one Embedded Metric Format record for a rotation step.
+        CloudWatch extracts per-step duration/success metrics from the log
+        line asynchronously, so we get metrics without a synchronous
+        (billed, throttlable) PutMetricData call on the rotation path.
+
+    Args:
+        step (str): Rotation step name (used as the metric dimension)
+        arn (str): Secret ARN, kept as a queryable field on the record
+        elapsed_ms (float): Step duration in milliseconds
+        success (bool): Whether the step completed without raising
+    """
+
+    # print() rather than logger: the Lambda runtime's log handler prefixes
+    # every logger record with "[LEVEL]\t<timestamp>\t<request-id>\t", which
+    # makes the event invalid JSON and the _aws directive unparseable. A bare
+    # stdout line still becomes its own CloudWatch log event.
+    print(json.dumps({
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": "SecretRotation",
+                "Dimensions": [["Step"]],
+                "Metrics": [
+                    {"Name": "DurationMs", "Unit": "Milliseconds"},
+                    {"Name": "Success", "Unit": "Count"}
+                ]
+            }]
+        },
+        "Step": step,
+        "SecretId": arn,
+        "DurationMs": round(elapsed_ms, 1),
+        "Success": 1 if success else 0
+    }))
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Purpose:
@@ -126,42 +373,47 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         The same error may appear in logs multiple times.
     """
 
+    # Validate all required keys in one membership pass - a single check
+    # reports every missing key at once instead of failing on the first
+    required = ('Step', 'SecretId', 'ClientRequestToken')
+    missing = [key for key in required if key not in event]
+    if missing:
+        logger.error(f"Missing required event parameters: {missing}")
+        raise ValueError(f"Missing required event parameters: {missing}")
+    step, arn, token = (event[key] for key in required)
+
     # Format the event received from AWS Secrets Manager for logging
+    # (built after validation so it reuses the already-extracted values)
     log_event = {
-        "Step": event.get("Step"),
-        "SecretId": event.get("SecretId", "N/A"),
+        "Step": step,
+        "SecretId": arn,
         "RequestId": context.aws_request_id if context else "N/A"
     }
     logger.info(f"Master rotation event received: {json.dumps(log_event)}")
 
-    # Validate that all required keys exist in the event
-    try:
-        step = event['Step']
-        arn = event['SecretId']
-        token = event['ClientRequestToken']
-    except KeyError as e:
-        logger.error(f"Missing required event parameter: {str(e)}")
-        raise ValueError(f"Missing required event parameter: {str(e)}")
-    
-    # Initialize Secrets Manager client
-    # Credentials are retrieved in order: Environment variables → AWS config files → IAM role(Lambda execution role)
-    service_client = boto3.client('secretsmanager')
+
+    # Reuse the module-level Secrets Manager client (created once at cold start)
+    service_client = get_service_client()
 
     # Execute the appropriate rotation step (main logic)
     try:
-        if step == 'createSecret':
-            create_secret(service_client, arn, token)
-        elif step == 'setSecret':
-            set_secret(service_client, arn, token)
-        elif step == 'testSecret':
-            test_secret(service_client, arn, token)
-        elif step == 'finishSecret':
-            finish_secret(service_client, arn, token)
-        else:
+        handler = _STEP_HANDLERS.get(step)
+        if handler is None:
             logger.error(f"Unknown step: {step}")
             raise ValueError(f"Unknown step: {step}")
-            
+
+        start = time.perf_counter()
+        try:
+            handler(service_client, arn, token, context)
+        except Exception:
+            # Record the failure too - a Success metric that only ever
+            # receives 1s cannot alarm on anything
+            _emit_step_metric(step, arn, (time.perf_counter() - start) * 1000, success=False)
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
         logger.info(f"Successfully completed master rotation step {step} for secret {arn}")
+        _emit_step_metric(step, arn, elapsed_ms, success=True)
         return {"statusCode": 200, "body": f"Master rotation step {step} completed successfully"}
 
     except Exception as e:
@@ -181,7 +433,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 #       └── get_random_password() ──────────────────── AWS Secrets Manager password generation
 #
 #   set_secret()
-#   └── get_secret() ───────────────────────────────── Get AWSCURRENT and AWSPENDING secret values
+#   ├── get_secret() ───────────────────────────────── Get AWSCURRENT and AWSPENDING secret values
+#   └── wait_for_rds_propagation() ─────────────────── Poll cluster until password change applies
 #
 #   test_secret()
 #   ├── get_secret() ───────────────────────────────── Get AWSPENDING secret value
@@ -190,13 +443,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 #   finish_secret()
 #   └── get_current_version() ──────────────────────── Get AWSCURRENT secret version ID
 
-def create_secret(service_client: BaseClient, arn: str, token: str) -> None:
+def create_secret(service_client: BaseClient, arn: str, token: str, context: Any = None) -> None:
     """
     Purpose:
         Create a new secret version with AWSPENDING stage and a newly generated password.
 
     Flow Summary:
-        1. Check if AWSPENDING version already exists for this token.
+        1. Check if AWSPENDING version already exists for this token
+           (describe_secret metadata - no KMS decrypt needed).
         2. Get current secret (AWSCURRENT) from Secrets Manager.
         3. Generate new secret with updated password.
         4. Store new secret with AWSPENDING stage.
@@ -205,6 +459,8 @@ def create_secret(service_client: BaseClient, arn: str, token: str) -> None:
         service_client (BaseClient): Boto3 Secrets Manager client
         arn (str): ARN of the secret to rotate
         token (str): Client request token (version ID)
+        context (object, optional): Lambda context (unused here; accepted
+            so all step handlers share one dispatch signature)
 
     Returns:
         None: Completes successfully or raises exception
@@ -223,58 +479,71 @@ def create_secret(service_client: BaseClient, arn: str, token: str) -> None:
     """
 
     try:
-        # Skip if AWSPENDING already exists for the same token
+        # Skip if AWSPENDING already exists for the same token. The probe uses
+        # describe_secret metadata (VersionIdsToStages) rather than
+        # get_secret_value: describe returns no secret material, so it avoids
+        # a KMS Decrypt and a ciphertext transfer on every retry of this step.
         try:
-            service_client.get_secret_value(SecretId=arn, VersionId=token, VersionStage=VERSION_STAGE_PENDING)
-            logger.info(f"AWSPENDING version already exists for secret {arn} with token {token}, skipping.")
-            return
-        except service_client.exceptions.ResourceNotFoundException:
-            # Expected - AWSPENDING doesn't exist yet, continue with creation
-            pass
+            metadata = _describe_secret_cached(service_client, arn)
+            if VERSION_STAGE_PENDING in metadata.get('VersionIdsToStages', {}).get(token, []):
+                logger.info(f"AWSPENDING version already exists for secret {arn} with token {token}, skipping.")
+                return
         except ClientError as e:
             if e.response['Error']['Code'] != 'ResourceNotFoundException':
                 logger.error(f"Unexpected error checking AWSPENDING for {arn}: {e}")
                 raise
         
-        # Get AWSCURRENT secret value using get_secret function()
-        # Generate new secret value using create_new_secret_value function()
-        current_secret = get_secret(service_client, arn, version_stage=VERSION_STAGE_CURRENT)
-        new_secret = create_new_secret_value(service_client, current_secret)
+        # Fetch the AWSCURRENT value and generate the replacement password
+        # concurrently - the random password does not depend on the current
+        # value, so the two round-trips overlap into one
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(get_secret, service_client, arn, None, VERSION_STAGE_CURRENT)
+            password_future = executor.submit(get_random_password, service_client)
+        current_secret = current_future.result()
+        new_secret = create_new_secret_value(service_client, current_secret, password_future.result())
         
         # Store new secret as AWSPENDING version
         # The token becomes the version ID for this new secret version
         service_client.put_secret_value(
             SecretId=arn,
             ClientRequestToken=token,
-            SecretString=json.dumps(new_secret),
+            SecretString=_json_dumps(new_secret),
             VersionStages=[VERSION_STAGE_PENDING]
         )
+        # The stage map just changed - evict the cached describe so a fast
+        # replay of this step sees the new AWSPENDING version and skips
+        _DESCRIBE_CACHE.pop(arn, None)
+        # Seed the value cache with what was just written, so set_secret and
+        # test_secret in the same warm container skip the fetch + KMS Decrypt
+        _SECRET_CACHE[(arn, token, VERSION_STAGE_PENDING)] = (time.monotonic() + SECRET_CACHE_TTL, new_secret)
         logger.info(f"Successfully created new AWSPENDING version for secret {arn} with token {token}.")
     except ClientError as e:
-        logger.error(f"ClientError in create_secret for ARN {arn}, token {token}: {e}", exc_info=True)
+        logger.error(f"ClientError in create_secret for ARN {arn}, token {token}: {e}")
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in create_secret for ARN {arn}, token {token}: {e}", exc_info=True)
+        logger.error(f"Unexpected error in create_secret for ARN {arn}, token {token}: {e}")
         raise
 
-def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
+def set_secret(service_client: BaseClient, arn: str, token: str, context: Any = None) -> None:
     """
     Purpose:
         Update the master user password in RDS/Aurora MySQL cluster using RDS modify_db_cluster API.
 
     Flow Summary:
-        1. Get current (AWSCURRENT) and pending (AWSPENDING) secrets.
+        1. Get current (AWSCURRENT) and pending (AWSPENDING) secrets concurrently.
         2. Extract cluster identifier from current secret and new password from pending secret.
         3. Call RDS modify_db_cluster API to update master password.
-        4. Wait for password propagation (default: 10 seconds).
+        4. Poll the cluster until the password change is applied (bounded wait).
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
         arn (str): ARN of the secret being rotated
         token (str): Client request token (version ID)
+        context (object, optional): Lambda context (unused here; accepted
+            so all step handlers share one dispatch signature)
 
     Environment Variables:
-        RDS_PASSWORD_PROPAGATION_WAIT: Wait time in seconds (default: 10)
+        RDS_PASSWORD_PROPAGATION_WAIT: Maximum propagation wait in seconds (default: 10)
 
     Returns:
         None: Completes successfully or raises exception
@@ -289,24 +558,32 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
         https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/rds/client/modify_db_cluster.html
 
     Note:
-        The wait time after password update is critical. RDS needs time to propagate
+        The wait after password update is critical. RDS needs time to propagate
         the new password. Testing too soon will cause authentication errors and
-        trigger unnecessary retries by Secrets Manager.
+        trigger unnecessary retries by Secrets Manager. The wait polls cluster
+        state and returns early once the change is applied (see
+        wait_for_rds_propagation).
     """
 
     try:
         logger.info(f"Setting master user password using RDS modify-db-cluster API for secret {arn}")
         
-        # Get current and pending master secrets
+        # Get current and pending master secrets concurrently - the two
+        # get_secret_value calls are independent, so overlapping them costs
+        # one round-trip instead of two (BatchGetSecretValue cannot select
+        # version stages, so threads are the batching mechanism here)
         try:
-            current_secret = get_secret(service_client, arn, version_stage=VERSION_STAGE_CURRENT)
-            pending_secret = get_secret(service_client, arn, token, VERSION_STAGE_PENDING)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                current_future = executor.submit(get_secret, service_client, arn, None, VERSION_STAGE_CURRENT)
+                pending_future = executor.submit(get_secret, service_client, arn, token, VERSION_STAGE_PENDING)
+            current_secret = current_future.result()
+            pending_secret = pending_future.result()
         except ClientError as e:
             logger.error(f"Failed to retrieve secrets from Secrets Manager for {arn}: {e}")
             raise
         
-        # Initialize RDS client
-        rds_client = boto3.client('rds')
+        # Reuse the module-level RDS client (created lazily on first setSecret)
+        rds_client = get_rds_client()
         
         # Extract cluster identifier from AWSCURRENT secret value and new password from AWSPENDING secret value
         cluster_identifier = current_secret.get('dbClusterIdentifier')
@@ -328,12 +605,10 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
                 ApplyImmediately=True
             )
             logger.info(f"Master password updated successfully using RDS API for secret {arn}")
-            
-            # Wait for RDS password change to propagate (default: 10 seconds)
-            wait_time = int(os.environ.get(ENV_RDS_PASSWORD_PROPAGATION_WAIT, DEFAULT_RDS_WAIT_TIME))
-            logger.info(f"Waiting {wait_time} seconds for RDS password change to propagate...")
-            time.sleep(wait_time)
-            logger.info(f"Password propagation wait completed")
+
+            # Poll the cluster until the password change has been applied,
+            # instead of sleeping for the full propagation budget every time
+            wait_for_rds_propagation(rds_client, cluster_identifier)
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -349,13 +624,13 @@ def set_secret(service_client: BaseClient, arn: str, token: str) -> None:
         logger.error(f"Validation error in set_secret for master {arn}: {str(e)}")
         raise
     except ClientError as e:
-        logger.error(f"AWS API error in set_secret for master {arn}: {str(e)}", exc_info=True)
+        logger.error(f"AWS API error in set_secret for master {arn}: {str(e)}")
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in set_secret for master {arn}: {str(e)}", exc_info=True)
+        logger.error(f"Unexpected error in set_secret for master {arn}: {str(e)}")
         raise
 
-def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
+def test_secret(service_client: BaseClient, arn: str, token: str, context: Any = None) -> None:
     """
     Purpose:
         Verify that the new master password (AWSPENDING) can successfully connect to the database.
@@ -364,16 +639,20 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
         1. Get AWSPENDING secret value from Secrets Manager.
         2. Extract database connection parameters (host, port, username, password).
         3. Attempt database connection with retry logic (handles propagation delay).
+           Retries back off exponentially with jitter, bounded by the remaining
+           Lambda execution time.
         4. Raise exception if all connection attempts fail.
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
         arn (str): ARN of the secret being tested
         token (str): Client request token (version ID)
+        context (object, optional): Lambda context; when provided, its
+            get_remaining_time_in_millis() bounds the total retry budget
 
     Environment Variables:
         DB_CONNECTION_TEST_RETRIES: Number of retries before failure (default: 3)
-        DB_CONNECTION_TEST_RETRY_DELAY: Seconds between retries (default: 5)
+        DB_CONNECTION_TEST_RETRY_DELAY: Maximum backoff between retries (default: 5)
 
     Returns:
         None: Completes successfully or raises exception
@@ -412,32 +691,64 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
         
         logger.info(f"Testing connection with new master password for user {username} for secret {arn}")
 
-        # Retry configuration for database password propagation
-        max_retries = int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRIES, DEFAULT_CONNECTION_RETRIES))
-        retry_delay = int(os.environ.get(ENV_DB_CONNECTION_TEST_RETRY_DELAY, DEFAULT_RETRY_DELAY))
-        
+        # Retry configuration for database password propagation. The env var
+        # caps the exponential backoff rather than acting as a fixed delay.
+        max_retries = _DB_RETRIES
+        max_delay = _DB_RETRY_DELAY
+
+        # Bound the total retry budget by the Lambda timeout (minus a safety
+        # margin) so a slow propagation raises a clear error here instead of
+        # the runtime killing the function mid-attempt
+        deadline = None
+        remaining_ms = getattr(context, 'get_remaining_time_in_millis', None)
+        if callable(remaining_ms):
+            deadline = time.monotonic() + max(remaining_ms() / 1000 - DEADLINE_BUFFER_SECONDS, 1.0)
+
         last_exception = None
-        # Python's range(start, stop) generates numbers from start to stop-1 
+        # Failed attempts are collected and emitted as one structured record
+        # instead of a warning per attempt - each log line is a synchronous
+        # write to the runtime log socket plus billed CloudWatch ingestion
+        failed_attempts = []
+        # Python's range(start, stop) generates numbers from start to stop-1
         for attempt in range(1, max_retries + 1):
             try:
                 # Test database connection with new password using test_database_connection function()
-                test_database_connection(host, port, username, password)
+                # Tight timeouts: a hung connect returns in seconds so the
+                # backoff loop keeps probing within the Lambda budget
+                test_database_connection(
+                    host, port, username, password,
+                    connect_timeout=DEFAULT_CONNECTION_TEST_TIMEOUT,
+                    read_timeout=DEFAULT_CONNECTION_TEST_TIMEOUT
+                )
+                if failed_attempts:
+                    logger.info(json.dumps({"test_secret_attempts": failed_attempts}))
                 logger.info(f"Successfully connected with new master password for user {username} for secret {arn}")
                 logger.info(f"Master secret tested successfully for {arn}")
                 return  # Success - exit function
 
-            except pymysql.err.OperationalError as e:
+            except (pymysql.err.OperationalError, socket.timeout) as e:
                 last_exception = e
                 error_code = e.args[0] if e.args else None
-                
-                # Retry if authentication error (1045) occurs and it's not the last attempt
-                if error_code == MYSQL_ERROR_ACCESS_DENIED and attempt < max_retries:
-                    # Write a warning to the log, then wait and retry
-                    logger.warning(f"Authentication failed on attempt {attempt}/{max_retries}. "
-                                 f"RDS password may still be propagating. Waiting {retry_delay} seconds before retry...")
-                    time.sleep(retry_delay)
+
+                # Retry on auth errors (1045 - password still propagating),
+                # connection refused (2003 - cluster mid-failover) and socket
+                # timeouts; anything else is not propagation-related
+                retryable = (isinstance(e, socket.timeout)
+                             or error_code in (MYSQL_ERROR_ACCESS_DENIED, MYSQL_ERROR_CONNECTION_REFUSED))
+                out_of_time = deadline is not None and time.monotonic() >= deadline
+                if retryable and attempt < max_retries and not out_of_time:
+                    # Exponential backoff (1s, 2s, 4s, ... capped) with jitter
+                    # so concurrent rotations don't probe in lockstep
+                    delay = min(max_delay, 2 ** (attempt - 1)) + random.uniform(0, 0.5)
+                    if deadline is not None:
+                        delay = min(delay, max(deadline - time.monotonic(), 0))
+                    failed_attempts.append({"attempt": attempt, "delay": round(delay, 2), "error": str(e)})
+                    time.sleep(delay)
                 else:
-                    # Non-retryable error or last attempt failed - raise exception
+                    # Non-retryable error, last attempt, or Lambda deadline
+                    # approaching - emit the attempt history once and raise
+                    failed_attempts.append({"attempt": attempt, "error": str(e)})
+                    logger.error(json.dumps({"test_secret_attempts": failed_attempts}))
                     raise
 
             except Exception as e:
@@ -452,7 +763,7 @@ def test_secret(service_client: BaseClient, arn: str, token: str) -> None:
         logger.error(f"Error in test_secret for master {arn}: {str(e)}")
         raise
 
-def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
+def finish_secret(service_client: BaseClient, arn: str, token: str, context: Any = None) -> None:
     """
     Purpose:
         Complete the rotation by promoting AWSPENDING to AWSCURRENT.
@@ -467,6 +778,8 @@ def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
         service_client (BaseClient): Boto3 Secrets Manager client
         arn (str): ARN of the secret being finalized
         token (str): Client request token (version ID)
+        context (object, optional): Lambda context (unused here; accepted
+            so all step handlers share one dispatch signature)
 
     Returns:
         None: Completes successfully or raises exception
@@ -508,12 +821,26 @@ def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
             MoveToVersionId=token,
             RemoveFromVersionId=current_version_id
         )
-        
+
+        # Stage labels just moved - drop everything cached for this secret
+        _invalidate_secret_cache(arn)
+
         logger.info(f"Master secret rotation completed successfully for {arn}")
         
     except Exception as e:
         logger.error(f"Error in finish_secret for master {arn}: {str(e)}")
-        raise 
+        raise
+
+# Dispatch table mapping Secrets Manager rotation steps to their handlers.
+# Built once at import time; lambda_handler resolves the step with a single
+# dict lookup. All handlers share the (service_client, arn, token, context)
+# signature so dispatch stays uniform.
+_STEP_HANDLERS = {
+    'createSecret': create_secret,
+    'setSecret': set_secret,
+    'testSecret': test_secret,
+    'finishSecret': finish_secret
+}
 
 # ============================================================================
 # Helper Functions
@@ -524,6 +851,7 @@ def finish_secret(service_client: BaseClient, arn: str, token: str) -> None:
 #   - get_secret(): Get secret value from Secrets Manager
 #   - create_new_secret_value(): Create new secret dict with generated password
 #   - get_random_password(): Generate secure password via AWS API
+#   - wait_for_rds_propagation(): Poll cluster until password change applies
 #   - test_database_connection(): Verify DB connectivity with SSL/TLS
 #   - get_current_version(): Get current secret version ID
 
@@ -538,10 +866,11 @@ def get_secret(
         Get secret value from AWS Secrets Manager for the specified version stage.
 
     Flow Summary:
-        1. Prepare parameters for API request.
-        2. Add version ID to parameters if token is specified.
+        1. Return the cached value if one exists and is fresh (see _SECRET_CACHE).
+        2. Build API parameters in one expression (VersionId only when a
+           token is specified).
         3. Call AWS Secrets Manager get_secret_value API.
-        4. Parse JSON string and return as dictionary.
+        4. Parse JSON string, cache it, and return as dictionary.
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
@@ -568,39 +897,57 @@ def get_secret(
         https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager/client/get_secret_value.html
     """
 
+    # Serve from the in-process TTL cache when possible - a hit avoids both
+    # the Secrets Manager round-trip and the KMS Decrypt behind it
+    cache_key = (arn, token, version_stage)
+    if SECRET_CACHE_TTL > 0:
+        cached = _SECRET_CACHE.get(cache_key)
+        if cached is not None:
+            expires_at, cached_secret = cached
+            if time.monotonic() < expires_at:
+                return cached_secret
+            _SECRET_CACHE.pop(cache_key, None)
+
     try:
+        # Single dict literal; the VersionId entry merges in only when a
+        # token was supplied, so the params are never mutated after creation
         params = {
             'SecretId': arn,
-            'VersionStage': version_stage
+            'VersionStage': version_stage,
+            **({'VersionId': token} if token is not None else {})
         }
 
-        # If token is specified, add version ID to params
-        if token is not None:
-            params['VersionId'] = token
-
         # Get secret value from AWS Secrets Manager and parse JSON
         response = service_client.get_secret_value(**params)
-        return json.loads(response['SecretString'])
+        secret = _json_loads(response['SecretString'])
+        if SECRET_CACHE_TTL > 0:
+            _SECRET_CACHE[cache_key] = (time.monotonic() + SECRET_CACHE_TTL, secret)
+        return secret
 
     except ClientError as e:
         logger.error(f"Error retrieving secret: '{arn}' {e}")
         raise
 
-def create_new_secret_value(service_client: BaseClient, current_secret: Dict[str, Any]) -> Dict[str, Any]:
+def create_new_secret_value(
+    service_client: BaseClient,
+    current_secret: Dict[str, Any],
+    new_password: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Purpose:
         Create a new secret dictionary by copying current secret and replacing password.
 
     Flow Summary:
         1. Validate that 'password' field exists in current secret.
-        2. Create a copy of the current secret dictionary.
-        3. Generate new password using get_random_password().
-        4. Replace 'password' field with newly generated password.
-        5. Return new secret dictionary.
+        2. Use the supplied password, or generate one via get_random_password().
+        3. Return a copy of the current secret with the 'password' field replaced,
+           built in a single dict-unpacking expression.
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
         current_secret (dict): Current secret dictionary from Secrets Manager
+        new_password (str, optional): Pre-generated password; create_secret
+            passes one so generation overlaps the AWSCURRENT fetch
 
     Returns:
         dict: New secret with all fields copied except password
@@ -627,14 +974,14 @@ def create_new_secret_value(service_client: BaseClient, current_secret: Dict[str
     # Validate that password field exists
     if 'password' not in current_secret:
         raise KeyError("The 'password' field is required in current_secret")
-    
-    # Copy the current secret
-    new_secret = current_secret.copy()
-    
-    # Generate new password using get_random_password function()
-    new_secret['password'] = get_random_password(service_client)
-    
-    return new_secret
+
+    # Single dict-unpacking expression instead of copy() + key assignment -
+    # one BUILD_MAP step that copies and overrides the password together
+    return {
+        **current_secret,
+        # Use the pre-generated password, or generate one with get_random_password()
+        'password': new_password if new_password is not None else get_random_password(service_client)
+    }
 
 def get_random_password(service_client: BaseClient) -> str:
     """
@@ -642,9 +989,9 @@ def get_random_password(service_client: BaseClient) -> str:
         Generate a secure random password using get_random_password API.
 
     Flow Summary:
-        1. Read password length and excluded characters from environment variables.
-        2. Call get_random_password API with password policy parameters.
-        3. Return generated password string.
+        1. Call get_random_password API with the password policy resolved at
+           module load (_PASSWORD_LENGTH / _EXCLUDE_CHARS).
+        2. Return generated password string.
 
     Args:
         service_client (BaseClient): Boto3 Secrets Manager client
@@ -672,35 +1019,105 @@ def get_random_password(service_client: BaseClient) -> str:
         https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetRandomPassword.html
     """
 
-    passwd = service_client.get_random_password(
-        PasswordLength=int(os.environ.get(ENV_PASSWORD_LENGTH, DEFAULT_PASSWORD_LENGTH)),
-        ExcludeCharacters=os.environ.get(ENV_EXCLUDE_CHARACTERS, DEFAULT_EXCLUDE_CHARACTERS),
-        ExcludeNumbers=False,
-        ExcludePunctuation=False,
-        ExcludeUppercase=False,
-        ExcludeLowercase=False,
-        IncludeSpace=False,
-        RequireEachIncludedType=True
-    )
+    passwd = service_client.get_random_password(**_PW_KWARGS)
     return passwd['RandomPassword']
 
-def test_database_connection(host: str, port: int, username: str, password: str) -> bool:
+def wait_for_rds_propagation(rds_client: BaseClient, cluster_identifier: str) -> None:
+    """
+    Purpose:
+        Wait until the RDS cluster has applied the master password change,
+        polling instead of sleeping for the full propagation budget.
+
+    Flow Summary:
+        1. Call describe_db_clusters for the rotated cluster.
+        2. Return as soon as Status is 'available' and MasterUserPassword has
+           left PendingModifiedValues.
+        3. Otherwise sleep 1 second and poll again until the budget expires.
+        4. On a non-transient describe error (e.g. AccessDenied), stop
+           polling and wait out the remaining budget in a single sleep.
+
+    Args:
+        rds_client (BaseClient): Boto3 RDS client
+        cluster_identifier (str): Identifier of the cluster being rotated
+
+    Environment Variables:
+        RDS_PASSWORD_PROPAGATION_WAIT: Maximum wait in seconds (default: 10)
+
+    Returns:
+        None: Always returns; an expired budget is only logged because
+              test_secret retries connectivity afterwards anyway.
+
+    References:
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/rds/client/describe_db_clusters.html
+
+    Note:
+        The previous implementation slept for the full budget unconditionally,
+        billing up to 10 seconds of idle Lambda time per rotation. Propagation
+        usually finishes in a couple of seconds, so polling exits early in the
+        common case while keeping the same worst-case bound.
+    """
+
+    max_wait = _RDS_WAIT
+    deadline = time.monotonic() + max_wait
+    logger.info(f"Waiting up to {max_wait} seconds for RDS password change to propagate...")
+
+    while True:
+        try:
+            response = rds_client.describe_db_clusters(DBClusterIdentifier=cluster_identifier)
+            cluster = response['DBClusters'][0]
+            if (cluster.get('Status') == 'available'
+                    and 'MasterUserPassword' not in cluster.get('PendingModifiedValues', {})):
+                logger.info(f"Password change applied on cluster {cluster_identifier}")
+                return
+        except ClientError as e:
+            # Describe is only an optimization - never fail the rotation on a
+            # polling error. Only throttling is worth retrying; a denial or
+            # other non-transient failure would just repeat once per second,
+            # so wait out the remaining budget in one sleep instead.
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code not in _TRANSIENT_RDS_POLL_ERRORS:
+                logger.warning(f"describe_db_clusters failed while polling propagation ({error_code}), waiting out the remaining budget: {e}")
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                return
+            logger.warning(f"describe_db_clusters throttled while polling propagation: {e}")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"Password propagation not confirmed within {max_wait} seconds, continuing")
+            return
+        time.sleep(min(1, remaining))
+
+def test_database_connection(
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    connect_timeout: int = DEFAULT_CONNECTION_TIMEOUT,
+    read_timeout: int = DEFAULT_CONNECTION_TIMEOUT
+) -> bool:
     """
     Purpose:
         Test database connection with provided credentials using SSL/TLS encryption.
 
     Flow Summary:
         1. Validate required parameters (host, port, username, password).
-        2. Check for CA certificate bundle path in environment variables.
-        3. Establish SSL/TLS connection to database.
-        4. Execute simple query (SELECT 1) to verify connection.
-        5. Close connection and return success.
+        2. Reuse a cached connection for the same credentials if one is still
+           live (verified with COM_PING), dropping it if the ping fails.
+        3. Otherwise establish a new SSL/TLS connection, verify it with
+           COM_PING, and cache it for later steps in this container.
+        4. Return success (connections are closed at runtime shutdown).
 
     Args:
         host (str): Database host address (e.g., cluster.region.rds.amazonaws.com)
         port (int): Database port number (typically 3306 for MySQL)
         username (str): Database user name
         password (str): Database password to test
+        connect_timeout (int, optional): Seconds to wait for the TCP/TLS
+            handshake (default: 30; testSecret passes a tight value)
+        read_timeout (int, optional): Seconds to wait for query responses
+            (default: 30; also applied to writes)
 
     Environment Variables:
         DB_CA_BUNDLE_PATH: Path to CA certificate bundle (optional)
@@ -721,10 +1138,10 @@ def test_database_connection(host: str, port: int, username: str, password: str)
         Exception: For unexpected errors
 
     SSL/TLS Configuration:
-        - If DB_CA_BUNDLE_PATH is set and file exists:
-          Uses explicit CA certificate with VERIFY_IDENTITY mode (full validation)
-        - Otherwise:
-          Uses system default CA certificates with certificate verification (recommended)
+        - Uses the module-level _SSL_CONTEXT, built once at import time:
+          explicit CA bundle if DB_CA_BUNDLE_PATH is set and the file exists,
+          system default CA certificates otherwise. Both modes enforce
+          certificate and hostname verification (CERT_REQUIRED + check_hostname).
 
     References:
         https://pymysql.readthedocs.io/en/latest/modules/connections.html
@@ -739,79 +1156,66 @@ def test_database_connection(host: str, port: int, username: str, password: str)
     if not isinstance(port, int) or port <= 0:
         raise ValueError(f"Invalid port number: {port}")
     
-    # Check if CA certificate bundle path is specified via environment variable
-    ca_bundle_path = os.environ.get(ENV_DB_CA_BUNDLE_PATH)
-
-    # Two SSL/TLS connection modes based on CA certificate availability
+    # Single connection path for both CA modes - since the TLS configuration
+    # lives in the module-level _SSL_CONTEXT (explicit CA bundle vs system CA,
+    # resolved at module load), the former Mode 1 / Mode 2 blocks differed
+    # only in their log message
     try:
-        # Mode 1: Use explicit CA certificate path (custom CA or specific AWS RDS CA bundle version)
-        #         Set DB_CA_BUNDLE_PATH environment variable to specify certificate path
-        #         Typical use case: Private CA, corporate CA, or certificate version control
-        if ca_bundle_path and os.path.exists(ca_bundle_path):
-            logger.info(f"Using SSL with explicit CA bundle: {ca_bundle_path}")
-            with pymysql.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                connect_timeout=DEFAULT_CONNECTION_TIMEOUT,
-                read_timeout=DEFAULT_CONNECTION_TIMEOUT,
-                write_timeout=DEFAULT_CONNECTION_TIMEOUT,
-                ssl_disabled=False,  # Enable SSL/TLS
-                ssl_ca=ca_bundle_path,  # Specify CA certificate path
-                ssl_verify_cert=True,  # Verify server certificate
-                ssl_verify_identity=True  # Verify hostname matches certificate
-            ) as conn:
-                # Execute simple query to verify connection works
-                with conn.cursor() as cur:
-                    cur.execute("SELECT 1")
-                    cur.fetchone()
-        
-        # Mode 2: Use system default CA certificates (includes AWS RDS CA bundle)
-        #         Recommended for standard AWS environments - no configuration needed
-        else:
-            logger.info("Using SSL with system default CA certificates")
-            with pymysql.connect(
+        # Reuse a cached session for the same credentials when one is live -
+        # the key includes the password hash, so a rotated password always
+        # forces a fresh handshake
+        cache_key = (host, port, username, hash(password))
+        conn = _CONN_CACHE.get(cache_key)
+        if conn is not None:
+            try:
+                # ping(reconnect=True) revalidates the cached session and
+                # transparently reconnects with the stored credentials
+                conn.ping(reconnect=True)
+            except Exception:
+                logger.debug(f"Cached connection to {host} is no longer usable, reconnecting")
+                _CONN_CACHE.pop(cache_key, None)
+                try:
+                    conn.close()
+                except Exception:
+                    pass  # Already broken - nothing useful to do
+                conn = None
+
+        if conn is None:
+            if _CA_BUNDLE_VALID:
+                logger.debug(f"Using SSL with explicit CA bundle: {_CA_BUNDLE_PATH}")
+            else:
+                logger.debug("Using SSL with system default CA certificates")
+            conn = pymysql.connect(
                 host=host,
                 port=port,
                 user=username,
                 password=password,
-                connect_timeout=DEFAULT_CONNECTION_TIMEOUT,
-                read_timeout=DEFAULT_CONNECTION_TIMEOUT,
-                write_timeout=DEFAULT_CONNECTION_TIMEOUT,
-                ssl_disabled=False,  # Enable SSL/TLS
-                # ssl_ca not specified - uses system CA (/etc/ssl/certs/ on Lambda)
-                ssl_verify_cert=True,  # Verify server certificate
-                ssl_verify_identity=True  # Verify hostname matches certificate
-            ) as conn:
-                # Execute simple query to verify connection works
-                with conn.cursor() as cur:
-                    cur.execute("SELECT 1")
-                    cur.fetchone()
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                write_timeout=read_timeout,
+                ssl=_SSL_CONTEXT  # Cert + hostname verification - see module-level context
+            )
+            # The completed handshake above already proved the credentials;
+            # COM_PING (single-byte command, OK-packet reply) confirms the
+            # session is live without a server-side query parse
+            conn.ping(reconnect=False)
+            # Keep the session for later steps in this container
+            _CONN_CACHE[cache_key] = conn
         
-        logger.info(f"Database connection test successful for user: {username}")
+        # Log the success once per host per container (see _LOGGED_HOSTS)
+        if host not in _LOGGED_HOSTS:
+            _LOGGED_HOSTS.add(host)
+            logger.info(f"Database connection test successful for user: {username}")
         return True
         
     except pymysql.err.OperationalError as e:
         # Handle MySQL operational errors (connection and authentication failures)
         error_code = e.args[0] if e.args else None
-        
-        # Authentication errors (error codes: 1045, 1044)
-        if error_code in (MYSQL_ERROR_ACCESS_DENIED, MYSQL_ERROR_ACCESS_DENIED_DB):
-            # 1045: Access denied (wrong password or user doesn't exist)
-            # 1044: Access denied to database (insufficient privileges)
-            logger.error(f"Authentication failed for user {username}: {str(e)}")
-        
-        # Connection errors (error codes: 2003, 2005, 2006)
-        elif error_code in (MYSQL_ERROR_CONNECTION_REFUSED, MYSQL_ERROR_UNKNOWN_HOST, MYSQL_ERROR_SERVER_GONE):
-            # 2003: Cannot connect (connection refused, firewall, wrong port)
-            # 2005: Unknown host (DNS resolution failure)
-            # 2006: Server has gone away (connection lost)
-            logger.error(f"Cannot connect to database at {host}:{port}: {str(e)}")
-        
-        # Other operational errors
-        else:
-            logger.error(f"Database operational error: {str(e)}")
+
+        # One dict lookup selects the message (see _MYSQL_ERROR_LOG_TEMPLATES)
+        # instead of an if/elif chain; logging interpolates the mapping lazily
+        template = _MYSQL_ERROR_LOG_TEMPLATES.get(error_code, 'Database operational error: %(error)s')
+        logger.error(template, {'host': host, 'port': port, 'username': username, 'error': e})
         raise
     
     except pymysql.err.MySQLError as e:
@@ -821,7 +1225,7 @@ def test_database_connection(host: str, port: int, username: str, password: str)
     
     except Exception as e:
         # Handle unexpected errors (network issues, SSL/TLS problems, etc.)
-        logger.error(f"Unexpected error during database connection test: {str(e)}", exc_info=True)
+        logger.error(f"Unexpected error during database connection test: {str(e)}")
         raise
 
 def get_current_version(service_client: BaseClient, arn: str) -> Optional[str]:
@@ -856,16 +1260,17 @@ def get_current_version(service_client: BaseClient, arn: str) -> Optional[str]:
     """
 
     try:
-        response = service_client.describe_secret(SecretId=arn)
-
-        # Find version ID that has AWSCURRENT label
-        for version_id, stages in response.get('VersionIdsToStages', {}).items():
-            # If AWSCURRENT label is found, return version ID
-            if VERSION_STAGE_CURRENT in stages:
-                return version_id
-
-        # If AWSCURRENT label is not found, return None
-        return None
+        response = _describe_secret_cached(service_client, arn)
+
+        # Find the version ID carrying the AWSCURRENT label; next() with a
+        # generator keeps the early exit while running the scan in C, and
+        # returns None when no version has the label
+        return next(
+            (version_id
+             for version_id, stages in response.get('VersionIdsToStages', {}).items()
+             if VERSION_STAGE_CURRENT in stages),
+            None
+        )
 
     except Exception as e:
         logger.error(f"Error in get_current_version for {arn}: {str(e)}")